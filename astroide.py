@@ -21,8 +21,8 @@ class Astroide(cc.PasAPas):
             lambda M: np.array([M[0], -M[1], 0]),
             "-t",
             (1,2),
-            Tex("On a $M(-t) = "+ tc.Matrix(["x(t)", "-y(t)"]) +"$").scale(0.7).move_to(cc.PasAPas.TEXT_DROITE),
-            Tex("M(-t) est le symétrique de M(t) par rapport à (Ox)").scale(0.7).move_to(cc.PasAPas.TEXT_DROITE),
+            cc.Differe(Tex, "On a $M(-t) = "+ tc.Matrix(["x(t)", "-y(t)"]) +"$").scale(0.7).move_to(cc.PasAPas.TEXT_DROITE),
+            cc.Differe(Tex, "M(-t) est le symétrique de M(t) par rapport à (Ox)").scale(0.7).move_to(cc.PasAPas.TEXT_DROITE),
             ["$[-\\pi, \\pi]$", "$[0, \\pi]$", "$[-\\pi, 0]$"],
             (0, np.pi), # p_range
             couleur=BLUE
@@ -32,8 +32,8 @@ class Astroide(cc.PasAPas):
             lambda M: np.array([-M[0], M[1], 0]),
             "$\\pi-t$",
             (0, 0.8),
-            Tex("On a $M(\\pi-t) = " + tc.Matrix(["-x(t)", "y(t)"]) + "$").scale(0.7).move_to(cc.PasAPas.TEXT_DROITE),
-            Tex("$M(\\pi-t)$ est le symétrique de M(t)\\\\ par rapport à (Oy)").scale(0.7).move_to(cc.PasAPas.TEXT_DROITE + LEFT*0.3),
+            cc.Differe(Tex, "On a $M(\\pi-t) = " + tc.Matrix(["-x(t)", "y(t)"]) + "$").scale(0.7).move_to(cc.PasAPas.TEXT_DROITE),
+            cc.Differe(Tex, "$M(\\pi-t)$ est le symétrique de M(t)\\\\ par rapport à (Oy)").scale(0.7).move_to(cc.PasAPas.TEXT_DROITE + LEFT*0.3),
             ["$[0, \\pi]$", f"$[0, {PI_2}]$", f"$[{PI_2}, \\pi]$"],
             (0, np.pi/2),
             couleur=ORANGE
@@ -43,8 +43,8 @@ class Astroide(cc.PasAPas):
             lambda M: np.array([M[1], M[0], 0]),
             f"${PI_2}-t$",
             (0.2, 0.6),
-            Tex(f"On a $M({PI_2}-t) = " + tc.Matrix(["y(t)", "x(t)"]) + "$").scale(0.7).move_to(cc.PasAPas.TEXT_DROITE),
-            Tex(f"$M({PI_2} - t)$ est le symétrique de M(t)\\\\ par rapport à $D : y = x$").scale(0.7).move_to(cc.PasAPas.TEXT_DROITE),
+            cc.Differe(Tex, f"On a $M({PI_2}-t) = " + tc.Matrix(["y(t)", "x(t)"]) + "$").scale(0.7).move_to(cc.PasAPas.TEXT_DROITE),
+            cc.Differe(Tex, f"$M({PI_2} - t)$ est le symétrique de M(t)\\\\ par rapport à $D : y = x$").scale(0.7).move_to(cc.PasAPas.TEXT_DROITE),
             [f"$[0, {PI_2}]$", f"$[0, {PI_4}]$", f"$[{PI_4}, {PI_2}$"],
             (0, np.pi/4),
             couleur=GREEN
@@ -0,0 +1,239 @@
+"""
+Micro-bancs d'essai des fonctions de calcul de :mod:`construction_courbe` et
+:mod:`tex_commands`, sans aucun rendu manim.
+
+Ce sont les morceaux appelés en boucle lors de la génération de nombreuses
+variantes de scènes :
+    - `PasAPas.courbe` sur un paramètre seul et sur un tableau
+    - le découpage d'une droite par le repère dans `Droite.trace`
+    - la mise en forme des équations dans `Asymptote.__init__`
+    - les chaînes de `Tangente.symetrique`
+    - `PointSingulier.presente`
+    - les chaînes produites par `Matrix`, `Command` et `Env`
+
+Pour chaque fonction on relève la distribution du temps par appel (minimum,
+médiane, 90e centile) et, avec tracemalloc, la mémoire maximale allouée par
+un appel ainsi que le nombre de blocs encore alloués après un grand nombre
+d'appels (une fuite ou un cache qui grossit s'y voit).
+
+Utilisation ::
+
+    python bench_math.py                    # compare à bench_math_reference.json
+    python bench_math.py --enregistre       # écrit la référence
+    python bench_math.py --seuil 0.25 --repetitions 20
+"""
+
+import argparse
+from fractions import Fraction
+import json
+from pathlib import Path
+import statistics
+import sys
+import timeit
+import tracemalloc
+import types
+
+import numpy as np
+
+import construction_courbe as cc
+import tex_commands as tc
+from lissajous import Lissajous
+from profilage import tableau_texte
+
+REFERENCE = Path(__file__).resolve().parent / "bench_math_reference.json"
+SEUIL = 0.25 # augmentation relative tolérée de la médiane
+REPETITIONS = 15 # nombre de mesures de chaque fonction
+APPELS_MEMOIRE = 1000 # appels pour le décompte des blocs retenus
+
+
+def _scene():
+    # instance sans renderer, comme pour le passage à blanc de PasAPas
+    scene = Lissajous.__new__(Lissajous)
+    scene._initialise_etat()
+    return scene
+
+def _repere():
+    # seuls les attributs utilisés par Droite.trace
+    return types.SimpleNamespace(
+        x_range=(-1.2, 1.2, 1),
+        y_range=(-1.2, 1.2, 1),
+        coords_to_point=lambda x, y, z=0: np.array([x, y, z])
+    )
+
+def _segment(start, end, color):
+    # remplace Line : on ne mesure que le découpage
+    return start, end
+
+
+def cas() -> dict:
+    """
+    Les fonctions mesurées, sans argument, par nom.
+    """
+    scene = _scene()
+    ts = np.linspace(-np.pi, np.pi, 1000)
+    repere = _repere()
+    droites = [
+        cc.Droite((1, -2, Fraction(1, 2)), type_ligne=_segment),
+        cc.Droite((0, 1, Fraction(-1, 3)), type_ligne=_segment),
+        cc.Droite((1, 0, 5), type_ligne=_segment)
+    ]
+    tangente = cc.Tangente(0.3, np.array([1, 2, 0]), 1/5)
+    symetries = Lissajous.SYMETRIES
+    point = cc.PointSingulier(
+        "0", cc.Tangente(0, np.array([-3, 0, 0], dtype=int), 1/15),
+        2, 3, cc.POINT_REBROUSSEMENT1
+    )
+    commande = tc.Command("underset")
+    env = tc.Env("aligned")
+
+    def droites_trace():
+        for droite in droites:
+            droite.trace(repere)
+
+    def asymptotes():
+        cc.Asymptote([Fraction(1, 2), -Fraction(3, 4)])
+        cc.Asymptote([Fraction(-2, 3), 0])
+        cc.AsymptoteVerticale(Fraction(-1, 2))
+        cc.AsymptoteHorizontale(3)
+
+    def tangente_symetrique():
+        t = tangente
+        for _ in range(4):
+            for sym in symetries:
+                t = t.symetrique(sym)
+
+    def tex_chaines():
+        tc.Matrix([[1, 2], [3, 4]])
+        tc.Matrix([1, -2], direction=tc.LIGNE)
+        commande("t \\to 0", "\\to")
+        tc.Frac(tc.D + "^2" + tc.Vect("OM"), tc.D + "t^2")
+        env("x &= 1 \\\\ y &= 2")
+
+    return {
+        "courbe scalaire": lambda: scene.courbe(0.7),
+        "courbe tableau (1000)": lambda: scene.courbe(ts),
+        "Droite.trace (3 droites)": droites_trace,
+        "Asymptote.__init__ (4)": asymptotes,
+        "Tangente.symetrique (8)": tangente_symetrique,
+        "PointSingulier.presente": point.presente,
+        "Matrix/Command/Env": tex_chaines
+    }
+
+
+def temps(fonction, repetitions=REPETITIONS) -> dict:
+    """
+    Distribution du temps par appel, en microsecondes.
+    """
+    minuteur = timeit.Timer(fonction)
+    nombre, _ = minuteur.autorange()
+    mesures = [t/nombre*1e6 for t in minuteur.repeat(repetitions, nombre)]
+    mesures.sort()
+    return {
+        "min": mesures[0],
+        "mediane": statistics.median(mesures),
+        "p90": mesures[min(int(0.9*len(mesures)), len(mesures) - 1)],
+        "appels": nombre*repetitions
+    }
+
+def allocations(fonction, appels=APPELS_MEMOIRE) -> dict:
+    """
+    Mémoire maximale allouée pendant un appel (octets) et nombre de blocs
+    encore alloués après `appels` appels.
+    """
+    fonction() # caches éventuels remplis hors mesure
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        debut, _ = tracemalloc.get_traced_memory()
+        fonction()
+        _, pic = tracemalloc.get_traced_memory()
+        avant = tracemalloc.take_snapshot()
+        for _ in range(appels):
+            fonction()
+        apres = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    retenus = sum(
+        stat.count_diff
+        for stat in apres.compare_to(avant, "lineno")
+        if stat.count_diff > 0 and stat.traceback[0].filename != tracemalloc.__file__
+    )
+    return {"pic": pic - debut, "blocs_retenus": retenus}
+
+
+def mesure(repetitions=REPETITIONS) -> dict:
+    # blocs retenus par la mesure elle-même
+    bruit = allocations(lambda: None)["blocs_retenus"]
+    resultats = {}
+    for nom, fonction in cas().items():
+        memoire = allocations(fonction)
+        memoire["blocs_retenus"] = max(memoire["blocs_retenus"] - bruit, 0)
+        resultats[nom] = {**temps(fonction, repetitions), **memoire}
+    return resultats
+
+
+def compare(resultats: dict, reference: dict, seuil=SEUIL) -> list:
+    """
+    Retourne la liste des régressions : médiane plus lente que la
+    référence au-delà du seuil, ou blocs retenus plus nombreux.
+    """
+    regressions = []
+    for nom, resultat in resultats.items():
+        ref = reference.get(nom)
+        if ref is None:
+            continue
+        if resultat["mediane"] > ref["mediane"]*(1 + seuil):
+            regressions.append(
+                f"{nom} : {resultat['mediane']:.2f} µs (référence {ref['mediane']:.2f} µs)"
+            )
+        if resultat["blocs_retenus"] > ref["blocs_retenus"]:
+            regressions.append(
+                f"{nom} : {resultat['blocs_retenus']} blocs retenus "
+                f"(référence {ref['blocs_retenus']})"
+            )
+    return regressions
+
+
+def tableau(resultats: dict) -> str:
+    entete = ["fonction", "min (µs)", "médiane", "p90", "pic (o)", "blocs retenus"]
+    lignes = [entete] + [
+        [
+            nom,
+            f"{r['min']:.2f}",
+            f"{r['mediane']:.2f}",
+            f"{r['p90']:.2f}",
+            str(r["pic"]),
+            str(r["blocs_retenus"])
+        ]
+        for nom, r in resultats.items()
+    ]
+    return tableau_texte(lignes)
+
+
+def main(arguments=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--reference", type=Path, default=REFERENCE)
+    parser.add_argument("--enregistre", action="store_true",
+        help="écrit les résultats comme nouvelle référence")
+    parser.add_argument("--seuil", type=float, default=SEUIL)
+    parser.add_argument("--repetitions", type=int, default=REPETITIONS)
+    args = parser.parse_args(arguments)
+
+    resultats = mesure(args.repetitions)
+    print(tableau(resultats))
+    if args.enregistre:
+        args.reference.write_text(json.dumps(resultats, indent=2), encoding="utf-8")
+        print(f"Référence écrite dans {args.reference}")
+        return 0
+    if not args.reference.exists():
+        print(f"Pas de référence ({args.reference}), utiliser --enregistre")
+        return 0
+    reference = json.loads(args.reference.read_text(encoding="utf-8"))
+    regressions = compare(resultats, reference, args.seuil)
+    for regression in regressions:
+        print("Régression :", regression)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
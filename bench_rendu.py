@@ -0,0 +1,254 @@
+"""
+Banc d'essai de bout en bout : rendu des scènes d'exemple en basse qualité,
+dans un dossier media temporaire.
+
+Chaque scène est rendue en mode complet et en mode `SKIP`, d'abord avec des
+caches LaTeX vides (démarrage à froid) puis avec les caches remplis par ce
+premier rendu (à chaud). Chaque rendu a lieu dans un processus neuf, pour que
+la mémoire maximale (RSS) et les imports soient mesurés indépendamment.
+
+Pour chaque rendu on relève :
+    - la durée totale et celle de chaque section (voir :mod:`profilage`)
+    - la mémoire résidente maximale, en Mo
+    - le nombre d'images écrites
+    - le nombre d'appels LaTeX dans le processus de rendu, et le nombre
+      de textes ajoutés au cache disque (précompilation parallèle comprise)
+
+Les résultats sont comparés à une référence JSON, avec des seuils de
+régression configurables. Le code de retour est 1 en cas de régression.
+
+Utilisation ::
+
+    python bench_rendu.py                   # compare à bench_reference.json
+    python bench_rendu.py --enregistre      # écrit la référence
+    python bench_rendu.py --scenes Astroide Lissajous --modes skip
+    python bench_rendu.py --seuil-temps 0.3 --seuil-memoire 0.2
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import time
+
+from profilage import tableau_texte
+
+DOSSIER = Path(__file__).resolve().parent
+
+# classe -> module
+SCENES = {
+    "CercleUnite": "cercle",
+    "Lissajous": "lissajous",
+    "Astroide": "astroide",
+    "Tractrice": "tractrice",
+    "BranchesInfiniesExemple": "bi_exemple"
+}
+MODES = ("complet", "skip")
+CACHES = ("froid", "chaud")
+
+REFERENCE = DOSSIER / "bench_reference.json"
+SEUIL_TEMPS = 0.15 # augmentation relative tolérée des durées
+SEUIL_MEMOIRE = 0.15 # augmentation relative tolérée de la mémoire
+DUREE_MIN_SECTION = 0.5 # les sections plus courtes ne sont pas comparées
+
+
+def mesure(classe: str, mode: str, sortie):
+    """
+    Rendu d'une scène dans le processus courant, qui doit être neuf.
+    Le résultat est écrit en JSON dans `sortie`.
+    """
+    import importlib
+    import resource
+
+    from manim import tempconfig
+    from manim.utils import tex_file_writing
+
+    import tex_commands as tc
+
+    appels_latex = 0
+    compile_tex = tex_file_writing.compile_tex
+    def compile_tex_compte(*args, **kwargs):
+        nonlocal appels_latex
+        appels_latex += 1
+        return compile_tex(*args, **kwargs)
+    tex_file_writing.compile_tex = compile_tex_compte
+
+    def textes_en_cache():
+        if tc.cache_tex is None:
+            return 0
+        return sum(1 for _ in tc.cache_tex.dossier.glob("*.svg"))
+
+    scene_classe = getattr(importlib.import_module(SCENES[classe]), classe)
+    if mode == "skip":
+        scene_classe = type(classe, (scene_classe,), {"SKIP": True})
+    with tempfile.TemporaryDirectory(prefix="courbes-bench-") as media:
+        options = {
+            "quality": "low_quality",
+            "media_dir": media,
+            "disable_caching": True,
+            "preview": False,
+            "progress_bar": "none",
+            "verbosity": "WARNING"
+        }
+        with tempconfig(options):
+            textes_avant = textes_en_cache()
+            scene = scene_classe()
+            scene.PROFILAGE = True
+            debut = time.perf_counter()
+            scene.render()
+            duree = time.perf_counter() - debut
+    profil = scene._profileur.rapport()
+    rss = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    ) # en ko sous Linux
+    resultat = {
+        "duree": duree,
+        "rss": rss / 1024,
+        "images": profil["images"],
+        "latex": appels_latex,
+        "textes_compiles": textes_en_cache() - textes_avant,
+        "sections": {section["nom"]: section["duree"] for section in profil["sections"]}
+    }
+    with open(sortie, "w", encoding="utf-8") as f:
+        json.dump(resultat, f)
+
+
+def lance(classe: str, mode: str, dossier_cache) -> dict:
+    """
+    Lance :func:`mesure` dans un nouveau processus, avec les caches LaTeX
+    dans `dossier_cache`.
+    """
+    env = dict(os.environ)
+    env["COURBES_CACHE_TEX"] = str(Path(dossier_cache) / "tex")
+    env["COURBES_FORMATS_TEX"] = str(Path(dossier_cache) / "formats")
+    env.pop("COURBES_PROFILAGE", None)
+    with tempfile.TemporaryDirectory() as dossier:
+        sortie = Path(dossier) / "resultat.json"
+        processus = subprocess.run(
+            [sys.executable, __file__, "--fils", classe, mode, str(sortie)],
+            cwd=DOSSIER,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        if processus.returncode != 0:
+            raise RuntimeError(
+                f"Échec du rendu de {classe} ({mode}) :\n{processus.stderr}"
+            )
+        return json.loads(sortie.read_text(encoding="utf-8"))
+
+
+def suite(scenes=SCENES, modes=MODES) -> dict:
+    """
+    Rendus à froid puis à chaud de chaque scène dans chaque mode.
+    Les clés du résultat sont de la forme `scene/mode/cache`.
+    """
+    resultats = {}
+    for classe in scenes:
+        for mode in modes:
+            with tempfile.TemporaryDirectory(prefix="courbes-cache-") as dossier_cache:
+                for cache in CACHES:
+                    cle = f"{classe}/{mode}/{cache}"
+                    print(f"{cle}...", end=" ", flush=True)
+                    resultats[cle] = lance(classe, mode, dossier_cache)
+                    print(f"{resultats[cle]['duree']:.1f} s")
+    return resultats
+
+
+def compare(resultats: dict, reference: dict,
+        seuil_temps=SEUIL_TEMPS, seuil_memoire=SEUIL_MEMOIRE) -> list:
+    """
+    Retourne la liste des régressions de `resultats` par rapport à
+    `reference`. Les rendus absents de la référence sont ignorés.
+    """
+    regressions = []
+    for cle, resultat in resultats.items():
+        ref = reference.get(cle)
+        if ref is None:
+            continue
+        if resultat["duree"] > ref["duree"]*(1 + seuil_temps):
+            regressions.append(
+                f"{cle} : durée {resultat['duree']:.2f} s (référence {ref['duree']:.2f} s)"
+            )
+        for nom, duree in resultat["sections"].items():
+            duree_ref = ref["sections"].get(nom)
+            if (duree_ref is not None and duree_ref >= DUREE_MIN_SECTION
+                    and duree > duree_ref*(1 + seuil_temps)):
+                regressions.append(
+                    f"{cle} : section {nom} {duree:.2f} s (référence {duree_ref:.2f} s)"
+                )
+        if resultat["rss"] > ref["rss"]*(1 + seuil_memoire):
+            regressions.append(
+                f"{cle} : mémoire {resultat['rss']:.0f} Mo (référence {ref['rss']:.0f} Mo)"
+            )
+        if resultat["images"] != ref["images"]:
+            regressions.append(
+                f"{cle} : {resultat['images']} images (référence {ref['images']})"
+            )
+        for compteur in ("latex", "textes_compiles"):
+            if resultat[compteur] > ref[compteur]:
+                regressions.append(
+                    f"{cle} : {compteur} {resultat[compteur]} (référence {ref[compteur]})"
+                )
+    return regressions
+
+
+def tableau(resultats: dict) -> str:
+    entete = ["rendu", "durée (s)", "RSS (Mo)", "images", "latex", "textes"]
+    lignes = [entete] + [
+        [
+            cle,
+            f"{r['duree']:.2f}",
+            f"{r['rss']:.0f}",
+            str(r["images"]),
+            str(r["latex"]),
+            str(r["textes_compiles"])
+        ]
+        for cle, r in resultats.items()
+    ]
+    return tableau_texte(lignes)
+
+
+def main(arguments=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scenes", nargs="+", choices=list(SCENES), default=list(SCENES))
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--reference", type=Path, default=REFERENCE)
+    parser.add_argument("--enregistre", action="store_true",
+        help="écrit les résultats comme nouvelle référence")
+    parser.add_argument("--seuil-temps", type=float, default=SEUIL_TEMPS)
+    parser.add_argument("--seuil-memoire", type=float, default=SEUIL_MEMOIRE)
+    parser.add_argument("--fils", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args(arguments)
+
+    if args.fils:
+        mesure(*args.fils)
+        return 0
+
+    resultats = suite(args.scenes, args.modes)
+    print(tableau(resultats))
+    if args.enregistre:
+        reference = {}
+        if args.reference.exists():
+            reference = json.loads(args.reference.read_text(encoding="utf-8"))
+        reference.update(resultats)
+        args.reference.write_text(json.dumps(reference, indent=2), encoding="utf-8")
+        print(f"Référence écrite dans {args.reference}")
+        return 0
+    if not args.reference.exists():
+        print(f"Pas de référence ({args.reference}), utiliser --enregistre")
+        return 0
+    reference = json.loads(args.reference.read_text(encoding="utf-8"))
+    regressions = compare(resultats, reference, args.seuil_temps, args.seuil_memoire)
+    for regression in regressions:
+        print("Régression :", regression)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+"""
+Chronologie d'une scène :class:`construction_courbe.PasAPas` sans rendu, et
+estimation du temps de rendu et de la taille de la vidéo.
+
+:meth:`PasAPas.chronologie` exécute `construct` à blanc : chaque appel à
+play ou wait est relevé (section, instant de début, durée, types
+d'animations, nombre d'objets animés et affichés) sans qu'aucune image ne
+soit produite. Cela permet de vérifier le rythme d'une vidéo (les multiples
+de `INTERVALLE_LEGENDE`) en une fraction de seconde.
+
+Le :class:`ModeleCout` estime ensuite le temps de rendu de chaque section :
+pendant une animation, chaque image redessine tous les objets affichés,
+alors qu'une attente sans animation répète la même image. Ses coefficients
+sont calibrés sur des rendus précédents, à partir des rapports du
+:mod:`profilage`.
+
+Utilisation ::
+
+    python chronologie.py Astroide
+    python chronologie.py Astroide --calibre media/profils/Astroide.json
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+import sys
+
+import numpy as np
+
+from profilage import tableau_texte
+
+MODELE = Path(
+    os.environ.get("COURBES_MODELE_COUT", Path.home() / ".cache" / "courbes-manim" / "modele_cout.json")
+)
+
+
+def _famille(mobject) -> int:
+    return len(mobject.get_family()) if hasattr(mobject, "get_family") else 1
+
+
+class Chronologie():
+    """
+    Liste des animations et attentes d'une scène, relevées pendant un
+    passage à blanc.
+
+    :param images_par_seconde: fréquence d'images de la vidéo.
+    """
+
+    def __init__(self, images_par_seconde=15):
+        self.images_par_seconde = images_par_seconde
+        self.evenements = []
+        self.sections = ["Début"]
+        self.temps = 0.0
+        self._affiches = {} # id -> mobject présents dans la scène
+
+    def section(self, nom: str):
+        self.sections.append(nom)
+
+    def ajoute(self, *mobjects):
+        for mobject in mobjects:
+            self._affiches[id(mobject)] = mobject
+
+    def retire(self, *mobjects):
+        for mobject in mobjects:
+            self._affiches.pop(id(mobject), None)
+
+    def _evenement(self, types, duree, animes, statique):
+        self.evenements.append({
+            "section": self.sections[-1],
+            "debut": self.temps,
+            "duree": duree,
+            "types": types,
+            "animes": animes,
+            "affiches": sum(_famille(m) for m in self._affiches.values()),
+            "statique": statique
+        })
+        self.temps += duree
+
+    def joue(self, *animations, **kwargs):
+        """
+        Relève un appel à play.
+        """
+        # mobject.animate donne un constructeur d'animation
+        animations = [a.build() if hasattr(a, "build") else a for a in animations]
+        mobjects = [a.mobject for a in animations if getattr(a, "mobject", None) is not None]
+        self.ajoute(*mobjects)
+        duree = kwargs.get("run_time") or max(
+            (getattr(a, "run_time", 1) for a in animations), default=0
+        )
+        self._evenement(
+            [type(a).__name__ for a in animations],
+            duree,
+            sum(_famille(m) for m in mobjects),
+            statique=False
+        )
+        self.retire(*[a.mobject for a in animations if getattr(a, "remover", False)])
+
+    def attend(self, duree=1.0, *args, **kwargs):
+        """
+        Relève un appel à wait.
+        """
+        self._evenement(["Wait"], duree, 0, statique=True)
+
+    def resume(self) -> dict:
+        """
+        Grandeurs par section utilisées par le modèle de coût : images
+        animées, images statiques, charge (images animées × objets affichés),
+        nombre d'animations et durée.
+        """
+        resume = {
+            nom: {"images_animees": 0.0, "images_statiques": 0.0, "charge": 0.0,
+                  "animations": 0, "duree": 0.0}
+            for nom in self.sections
+        }
+        for evenement in self.evenements:
+            section = resume[evenement["section"]]
+            images = evenement["duree"]*self.images_par_seconde
+            section["duree"] += evenement["duree"]
+            if evenement["statique"]:
+                section["images_statiques"] += images
+            else:
+                section["images_animees"] += images
+                section["charge"] += images*evenement["affiches"]
+                section["animations"] += 1
+        return resume
+
+    def tableau(self) -> str:
+        entete = ["section", "début (s)", "durée (s)", "animations", "animés", "affichés"]
+        lignes = [entete] + [
+            [
+                e["section"],
+                f"{e['debut']:.1f}",
+                f"{e['duree']:.1f}",
+                ", ".join(e["types"]),
+                str(e["animes"]),
+                str(e["affiches"])
+            ]
+            for e in self.evenements
+        ]
+        return tableau_texte(lignes, gauche=(0, 3))
+
+
+class ModeleCout():
+    """
+    Modèle linéaire du temps de rendu d'une section :
+
+        temps = charge × c_charge + images animées × c_animee
+                + images statiques × c_statique + animations × c_animation
+
+    et de la taille de la vidéo : octets par image × nombre d'images.
+
+    :param coefficients: dictionnaire des coefficients, valeurs par défaut
+        approximatives (basse qualité, renderer Cairo) si absent.
+    """
+
+    GRANDEURS = ("charge", "images_animees", "images_statiques", "animations")
+    DEFAUT = {
+        "charge": 2e-5,
+        "images_animees": 1e-2,
+        "images_statiques": 5e-4,
+        "animations": 5e-2,
+        "octets_par_image": 3000.0
+    }
+
+    def __init__(self, coefficients=None):
+        self.coefficients = dict(self.DEFAUT)
+        self.coefficients.update(coefficients or {})
+
+    @classmethod
+    def charge_fichier(cls, chemin=MODELE):
+        chemin = Path(chemin)
+        if not chemin.exists():
+            return cls()
+        return cls(json.loads(chemin.read_text(encoding="utf-8")))
+
+    def enregistre(self, chemin=MODELE):
+        chemin = Path(chemin)
+        chemin.parent.mkdir(parents=True, exist_ok=True)
+        chemin.write_text(json.dumps(self.coefficients, indent=2), encoding="utf-8")
+
+    def estime(self, chronologie: Chronologie) -> dict:
+        """
+        Temps de rendu estimé par section et au total (secondes), et taille
+        estimée de la vidéo (octets).
+        """
+        sections = {
+            nom: sum(grandeurs[g]*self.coefficients[g] for g in self.GRANDEURS)
+            for nom, grandeurs in chronologie.resume().items()
+        }
+        images = sum(e["duree"] for e in chronologie.evenements)*chronologie.images_par_seconde
+        return {
+            "sections": sections,
+            "temps": sum(sections.values()),
+            "duree_video": chronologie.temps,
+            "taille": images*self.coefficients["octets_par_image"]
+        }
+
+    @classmethod
+    def calibre(cls, paires):
+        """
+        Ajuste les coefficients par moindres carrés (positifs) sur des
+        rendus précédents.
+
+        :param paires: liste de couples (Chronologie, rapport de
+            :class:`profilage.Profileur`) d'une même scène. Les sections sont
+            appariées par nom ; la taille de la vidéo est lue si le rapport
+            donne son chemin.
+        """
+        lignes, temps = [], []
+        octets, images = 0.0, 0.0
+        for chronologie, rapport in paires:
+            resume = chronologie.resume()
+            for section in rapport["sections"]:
+                grandeurs = resume.get(section["nom"])
+                if grandeurs is None:
+                    continue
+                lignes.append([grandeurs[g] for g in cls.GRANDEURS])
+                # la construction et LaTeX ne dépendent pas des images
+                temps.append(sum(
+                    section["phases"][phase] for phase in ("animation", "rendu", "ecriture")
+                ))
+            video = rapport.get("video")
+            if video and Path(video).exists():
+                octets += Path(video).stat().st_size
+                images += rapport["images"]
+        coefficients = {}
+        if lignes:
+            a = np.array(lignes, dtype=float)
+            b = np.array(temps)
+            actives = list(range(len(cls.GRANDEURS)))
+            # moindres carrés, en retirant les coefficients négatifs
+            while actives:
+                x, *_ = np.linalg.lstsq(a[:, actives], b, rcond=None)
+                if (x >= 0).all():
+                    break
+                actives.pop(int(np.argmin(x)))
+            for i, grandeur in enumerate(cls.GRANDEURS):
+                coefficients[grandeur] = float(x[actives.index(i)]) if i in actives else 0.0
+        if images > 0:
+            coefficients["octets_par_image"] = octets/images
+        return cls(coefficients)
+
+
+def main(arguments=None) -> int:
+    import importlib
+
+    import rendu_lot
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("scene", help="classe de la scène")
+    parser.add_argument("--calibre", nargs="+", type=Path, default=None,
+        help="rapports de profilage de cette scène pour calibrer le modèle")
+    parser.add_argument("--modele", type=Path, default=MODELE)
+    args = parser.parse_args(arguments)
+
+    module = importlib.import_module(rendu_lot.decouvre()[args.scene])
+    chronologie = getattr(module, args.scene).chronologie()
+    print(chronologie.tableau())
+    if args.calibre:
+        rapports = [json.loads(chemin.read_text(encoding="utf-8")) for chemin in args.calibre]
+        modele = ModeleCout.calibre([(chronologie, rapport) for rapport in rapports])
+        modele.enregistre(args.modele)
+        print(f"Modèle calibré enregistré dans {args.modele}")
+    else:
+        modele = ModeleCout.charge_fichier(args.modele)
+    estimation = modele.estime(chronologie)
+    for nom, temps in estimation["sections"].items():
+        print(f"{nom} : {temps:.1f} s")
+    print(
+        f"Vidéo de {estimation['duree_video']:.1f} s, rendu estimé à "
+        f"{estimation['temps']:.1f} s, taille estimée {estimation['taille']/1e6:.1f} Mo"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
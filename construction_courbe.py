@@ -4,21 +4,318 @@ Module de base pour la construction de courbes paramétrée animée par manim.
 import abc
 import collections.abc
 from fractions import Fraction
+import hashlib
+import os
+from pathlib import Path
+import sys
+import types
 
 import tex_commands as tc
+from chronologie import Chronologie
+from profilage import Profileur
 # import logging_conf
 
 from manim import *
+from manim.animation.animation import prepare_animation
+from manim.utils.exceptions import EndSceneEarlyException
 import numpy as np
 
 __version__ = 0.4
 
 
-# pour l'instant on utilise seulement print pour les log
-def logger():
-    pass
+# pour l'instant on utilise seulement print pour les log (voir tex_commands)
+logger = tc.logger
+
+def echantillonne(fonction, t_min, t_max, tolerance, budget=2000,
+                  n_initial=32, angle_max=np.pi/12, cadre=None):
+    """
+    Échantillonnage adaptatif d'une courbe sur [t_min, t_max].
+
+    On part d'une subdivision régulière grossière, puis on coupe en deux les
+    intervalles dont le milieu s'écarte de la corde de plus de `tolerance`,
+    ou qui encadrent un virage plus marqué que `angle_max` (points de
+    rebroussement, forte courbure). Les parties presque droites gardent
+    donc peu de points.
+
+    :param fonction: prend un np.array de paramètres de taille n et retourne
+        les points correspondants sous forme d'un np.array de forme (n, 3).
+    :param tolerance: écart maximal toléré entre la courbe et sa ligne
+        brisée, dans l'unité des points retournés par `fonction`.
+    :param budget: nombre maximal de points retournés. Lorsqu'il est
+        atteint, on raffine en priorité les plus grands écarts.
+    :param n_initial: nombre d'intervalles de la subdivision initiale.
+    :param angle_max: angle (en radians) au delà duquel un sommet de la
+        ligne brisée est considéré comme un virage à raffiner.
+    :param cadre: (optionnel) demi-largeur et demi-hauteur de la zone visible,
+        centrée en l'origine. Les intervalles entièrement hors de cette zone
+        ne sont pas raffinés.
+
+    Retourne le couple (ts, points).
+    """
+    ts = np.linspace(t_min, t_max, n_initial + 1)
+    points = np.asarray(fonction(ts), dtype=float)
+    dt_min = (t_max - t_min) * 1e-6
+    a_raffiner = np.ones(len(ts) - 1, dtype=bool)
+    while len(ts) < budget:
+        debuts, fins = points[:-1], points[1:]
+        valides = (
+            np.isfinite(debuts).all(axis=1) & np.isfinite(fins).all(axis=1)
+            & (np.diff(ts) > dt_min)
+        )
+        # virages trop marqués : les deux segments adjacents sont concernés
+        cordes = fins - debuts
+        longueurs = np.linalg.norm(cordes, axis=1)
+        u, v = cordes[:-1], cordes[1:]
+        angles = np.arctan2(
+            np.abs(u[:, 0]*v[:, 1] - u[:, 1]*v[:, 0]),
+            np.einsum("ij,ij->i", u, v)
+        )
+        virages = (angles > angle_max) & (np.maximum(longueurs[:-1], longueurs[1:]) > tolerance)
+        en_virage = np.zeros(len(ts) - 1, dtype=bool)
+        en_virage[:-1] |= virages
+        en_virage[1:] |= virages
+        en_virage &= longueurs > tolerance
+        if cadre is not None:
+            hors = np.zeros(len(ts) - 1, dtype=bool)
+            for axe in range(2):
+                hors |= (debuts[:, axe] > cadre[axe]) & (fins[:, axe] > cadre[axe])
+                hors |= (debuts[:, axe] < -cadre[axe]) & (fins[:, axe] < -cadre[axe])
+            valides &= ~hors
+        candidats = np.flatnonzero((a_raffiner | en_virage) & valides)
+        if len(candidats) == 0:
+            break
+        t_milieux = (ts[candidats] + ts[candidats + 1]) / 2
+        milieux = np.asarray(fonction(t_milieux), dtype=float)
+        # distance du milieu à la corde
+        corde = cordes[candidats]
+        relatif = milieux - debuts[candidats]
+        norme = np.maximum(longueurs[candidats], 1e-12)
+        ecarts = np.abs(corde[:, 0]*relatif[:, 1] - corde[:, 1]*relatif[:, 0]) / norme
+        # si la corde est quasi nulle, on mesure l'écart au point de départ
+        ecarts = np.where(
+            longueurs[candidats] > 1e-12, ecarts, np.linalg.norm(relatif, axis=1)
+        )
+        ecarts = np.where(np.isfinite(milieux).all(axis=1), ecarts, 0)
+        priorites = ecarts / tolerance + en_virage[candidats]
+        coupes = np.flatnonzero(priorites > 1)
+        if len(coupes) == 0:
+            break
+        place = budget - len(ts)
+        if len(coupes) > place:
+            coupes = coupes[np.argsort(priorites[coupes])[::-1][:place]]
+            coupes.sort()
+        indices = candidats[coupes] + 1
+        ts = np.insert(ts, indices, t_milieux[coupes])
+        points = np.insert(points, indices, milieux[coupes], axis=0)
+        # seules les deux moitiés des intervalles coupés sont à retester
+        a_raffiner = np.zeros(len(ts) - 1, dtype=bool)
+        nouveaux = indices + np.arange(len(indices))
+        a_raffiner[nouveaux - 1] = True
+        a_raffiner[nouveaux] = True
+    return ts, points
+
+
+class Differe():
+    """
+    Construction différée d'un objet manim.
+
+    Les textes définis comme attributs de classe sont construits, et donc
+    compilés, dès l'import du module. Pour ne les construire qu'au moment où
+    ils sont utilisés, on écrit par exemple ::
+
+        Differe(Tex, "M(-t) = ...").scale(0.7).move_to(PasAPas.TEXT_DROITE)
+
+    Les appels de méthodes sont enregistrés, puis rejoués sur l'objet
+    lors de l'appel de l'instance, qui retourne l'objet construit.
+
+    :param classe: la classe (ou fonction) à appeler, Tex, Text...
+    :param args:
+    :param kwargs: les arguments à lui passer.
+    """
+
+    def __init__(self, classe, *args, **kwargs):
+        self.classe = classe
+        self.args = args
+        self.kwargs = kwargs
+        self.appels = [] # (nom de méthode, args, kwargs)
+    
+    def __getattr__(self, nom):
+        if nom.startswith("_"):
+            raise AttributeError(nom)
+        def enregistre(*args, **kwargs):
+            self.appels.append((nom, args, kwargs))
+            return self
+        return enregistre
+    
+    def __call__(self):
+        objet = self.classe(*self.args, **self.kwargs)
+        for nom, args, kwargs in self.appels:
+            resultat = getattr(objet, nom)(*args, **kwargs)
+            objet = objet if resultat is None else resultat
+        return objet
+
+def materialise(spec):
+    """
+    Retourne l'objet manim décrit par spec : spec lui-même si c'est déjà un
+    objet manim, le résultat de son appel si c'est une fonction sans argument
+    ou un :class:`Differe`.
+    """
+    return spec() if callable(spec) else spec
+
+class CacheObjets():
+    """
+    Cache, dans le processus, des objets manim construits à l'identique
+    plusieurs fois au cours d'un rendu : étiquettes `M(t)`, titres
+    d'épisodes, phrases fixes. Un objet est construit une fois (analyse du
+    SVG, mise en page Pango), puis chaque demande en reçoit une copie, que
+    l'on peut déplacer ou redimensionner librement.
+
+    La clé est la classe et les arguments de construction (texte, template,
+    style). Les objets les moins récemment demandés sont retirés lorsque la
+    taille totale de leurs points dépasse `taille_max` (en octets).
+
+    Rien n'est conservé pendant un :class:`tex_commands.EnregistreurTex` :
+    les textes n'y ont qu'une géométrie fictive.
+    """
+
+    def __init__(self, taille_max: int = 50_000_000):
+        self.taille_max = taille_max
+        self.taille = 0
+        self.entrees = collections.OrderedDict() # clé -> (objet, taille)
+        self.succes = 0
+        self.echecs = 0
+
+    @staticmethod
+    def cle(classe, args, kwargs):
+        """
+        Retourne la clé des arguments, ou None s'ils ne sont pas hachables.
+        """
+        cle = (classe, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(cle)
+        except TypeError:
+            return None
+        return cle
+
+    def obtient(self, classe, *args, **kwargs):
+        """
+        Retourne une copie de `classe(*args, **kwargs)`.
+        """
+        cle = self.cle(classe, args, kwargs)
+        if cle is None:
+            return classe(*args, **kwargs)
+        entree = self.entrees.get(cle)
+        if entree is not None:
+            self.entrees.move_to_end(cle)
+            self.succes += 1
+            return entree[0].copy()
+        self.echecs += 1
+        objet = classe(*args, **kwargs)
+        if tc.EnregistreurTex.actifs:
+            return objet
+        taille = sum(m.points.nbytes for m in objet.get_family())
+        if taille > self.taille_max:
+            return objet
+        self.entrees[cle] = (objet, taille)
+        self.taille += taille
+        while self.taille > self.taille_max:
+            _, (_, retiree) = self.entrees.popitem(last=False)
+            self.taille -= retiree
+        # l'objet en cache ne doit pas être modifié par l'appelant
+        return objet.copy()
+
+    def vide(self):
+        self.entrees.clear()
+        self.taille = 0
+
+cache_objets = CacheObjets()
+
+def interne(classe, *args, **kwargs):
+    """
+    Comme `classe(*args, **kwargs)`, mais l'objet est pris dans
+    :data:`cache_objets` s'il a déjà été construit avec les mêmes
+    arguments. Par exemple `interne(Tex, "M(t)")`.
+    """
+    return cache_objets.obtient(classe, *args, **kwargs)
+
+# fichiers lus pendant la section en cours d'un passage à blanc avec
+# empreintes, relevés par _audit_lectures
+_fichiers_lus = None
+_audit_installe = False
+
+def _audit_lectures(evenement, arguments):
+    if _fichiers_lus is None or evenement != "open":
+        return
+    chemin, mode = arguments[0], arguments[1]
+    if isinstance(chemin, (str, bytes, os.PathLike)) and not set(str(mode or "")) & set("wax+"):
+        _fichiers_lus.add(os.fsdecode(chemin))
+
+def _suit_lectures(fichiers):
+    """
+    Ajoute désormais à l'ensemble `fichiers` le chemin de chaque fichier
+    ouvert en lecture, jusqu'à l'appel suivant (None pour arrêter).
+    """
+    global _fichiers_lus, _audit_installe
+    if not _audit_installe:
+        # un hook d'audit ne peut pas être retiré : il est installé une fois
+        sys.addaudithook(_audit_lectures)
+        _audit_installe = True
+    _fichiers_lus = fichiers
+
+def empreinte(valeur, h, vus=None):
+    """
+    Ajoute à l'objet hashlib `h` une description de `valeur` stable d'une
+    exécution à l'autre : pas d'adresse mémoire, le code des fonctions
+    plutôt que leur identité, la géométrie et les textes des objets manim.
+    """
+    vus = set() if vus is None else vus
+    if isinstance(valeur, (str, bytes, int, float, complex, Fraction, type(None))):
+        h.update(repr(valeur).encode())
+        return
+    if id(valeur) in vus:
+        return
+    vus.add(id(valeur))
+    if isinstance(valeur, np.ndarray):
+        h.update(str(valeur.dtype).encode())
+        h.update(np.ascontiguousarray(valeur).tobytes())
+    elif isinstance(valeur, types.CodeType):
+        h.update(valeur.co_code)
+        h.update(repr(valeur.co_names).encode())
+        for constante in valeur.co_consts:
+            empreinte(constante, h, vus)
+    elif isinstance(valeur, types.MethodType):
+        empreinte(valeur.__func__, h, vus)
+    elif isinstance(valeur, types.FunctionType):
+        empreinte(valeur.__code__, h, vus)
+        empreinte(valeur.__defaults__, h, vus)
+        for cellule in valeur.__closure__ or ():
+            empreinte(cellule.cell_contents, h, vus)
+    elif isinstance(valeur, type):
+        h.update(f"{valeur.__module__}.{valeur.__qualname__}".encode())
+    elif isinstance(valeur, dict):
+        for cle in sorted(valeur, key=repr):
+            empreinte(cle, h, vus)
+            empreinte(valeur[cle], h, vus)
+    elif isinstance(valeur, (list, tuple)):
+        h.update(f"{type(valeur).__name__}{len(valeur)}".encode())
+        for element in valeur:
+            empreinte(element, h, vus)
+    elif isinstance(valeur, Mobject):
+        h.update(type(valeur).__name__.encode())
+        for attribut in ("tex_string", "text", "color", "stroke_width"):
+            empreinte(str(getattr(valeur, attribut, "")), h, vus)
+        for attribut in ("fill_rgbas", "stroke_rgbas"):
+            if hasattr(valeur, attribut):
+                empreinte(np.round(np.asarray(getattr(valeur, attribut), dtype=float), 4), h, vus)
+        empreinte(np.round(valeur.points, 4), h, vus)
+        empreinte(valeur.submobjects, h, vus)
+    elif hasattr(valeur, "__dict__"):
+        h.update(type(valeur).__qualname__.encode())
+        empreinte(vars(valeur), h, vus)
+    else:
+        description = repr(valeur)
+        h.update((type(valeur).__qualname__ if "0x" in description else description).encode())
 
-logger.info = print
 
 class Symetrie():
     """
@@ -38,6 +335,9 @@ class Symetrie():
         Par exemple "M(-t) = (-x(t), y(t))"
     :param conclusion: est un Text de conclusion sur la symétrie.
         "M(-t) est le symétrique de M(t) par rapport à (Oy)"
+        Ces deux textes peuvent aussi être donnés sous forme différée
+        (:class:`Differe` ou fonction sans argument), ils ne sont alors
+        construits que lors de la présentation de la symétrie.
     :param intervalles: est une liste de 3 str contenant les intervalles :
         complet, pour M(t), pour son symétrique. Le premier intervalle
         n'est pas utilisé pour l'instant.
@@ -46,11 +346,15 @@ class Symetrie():
         les paramètres donnés à :class:`PasAPas`.
     :param couleur: (optionnel) est chaîne de couleur à utiliser pour le tracé
         du morceau de courbe symétrique.
+    :param affine: (optionnel) si True (par défaut), sym_M est supposée affine
+        et le morceau symétrique est tracé comme image des points déjà
+        calculés, sans nouvelle évaluation de la courbe. Passer False pour
+        forcer le recalcul.
     """
 
     def __init__(self, transforme, sym_M, texte, parametres,
                  presentation, conclusion, intervalles,
-                 p_range, couleur="#FFFFFF"):
+                 p_range, couleur="#FFFFFF", affine=True):
         self.transforme = transforme
         self.sym_M = sym_M
         self.texte = texte
@@ -60,6 +364,32 @@ class Symetrie():
         self.intervalles = intervalles # 3 Text : complet, moitié1, moitié2
         self.p_range = p_range
         self.couleur = couleur
+        self.affine = affine
+        self._matrice_affine = None
+    
+    def matrice_affine(self):
+        """
+        Retourne un couple (matrice, vecteur) tel que
+        sym_M(M) = matrice @ M + vecteur, calculé sur la base canonique.
+
+        Retourne None si l'utilisateur a passé affine=False, ou si sym_M ne
+        vérifie pas cette égalité sur quelques points de contrôle.
+        """
+        if not self.affine:
+            return None
+        if self._matrice_affine is None:
+            vecteur = np.asarray(self.sym_M(np.zeros(3)), dtype=float)
+            matrice = np.array(
+                [self.sym_M(e) for e in np.eye(3)], dtype=float
+            ).T - vecteur[:, None]
+            controles = np.random.default_rng(0).normal(size=(4, 3))
+            if all(np.allclose(self.sym_M(M), matrice @ M + vecteur) for M in controles):
+                self._matrice_affine = (matrice, vecteur)
+            else:
+                logger.info(f"Symétrie M({self.texte}) non affine, recalcul du tracé")
+                self.affine = False
+                return None
+        return self._matrice_affine
     
     def anime_symetrie(self, scene):
         # scene est la scene de référence qui est une sous classe de PasAPas
@@ -67,21 +397,20 @@ class Symetrie():
         # passés à l'initialisation
         t1, t2 = self.params
         M = Dot(point=scene.repere.coords_to_point(*scene.courbe(t1)))
-        txt_M = Tex("M(t)").next_to(M, UP/2)
+        txt_M = interne(Tex, "M(t)").next_to(M, UP/2)
         sym = Dot(point=scene.repere.coords_to_point(
             *scene.courbe(self.transforme(t1))
         ))
-        txt_sym = Tex("M({})".format(self.texte)).next_to(sym, UP/2)
+        txt_sym = interne(Tex, "M({})".format(self.texte)).next_to(sym, UP/2)
         GM = Group(M, txt_M)
         Gsym = Group(sym, txt_sym)
         self.groups = [GM, Gsym]
         scene.add(*self.groups)
         scene.wait(scene.INTERVALLE_LEGENDE)
+        # les deux points suivent la courbe, au même paramètre t
         scene.play(
-            GM.animate.move_to( scene.repere.coords_to_point(*scene.courbe(t2)) ),
-            Gsym.animate.move_to(
-                scene.repere.coords_to_point(*scene.courbe(self.transforme(t2)) )
-            )
+            MoveAlongCourbe(GM, scene, t1, t2),
+            MoveAlongCourbe(Gsym, scene, t1, t2, transforme=self.transforme)
         )
         scene.wait(scene.INTERVALLE_LEGENDE)
     
@@ -114,10 +443,10 @@ class Symetrie():
         Présente la symétrie, anime un point et son symétrique,
         puis conclue sur la symétrie trouvée.
         """
-        scene.affiche_texte(self.presentation, remplace=True)
+        scene.affiche_texte(materialise(self.presentation), remplace=True)
         scene.wait(scene.INTERVALLE_LEGENDE*1.2)
         self.anime_symetrie(scene)
-        scene.affiche_texte(self.conclusion, remplace=True)
+        scene.affiche_texte(materialise(self.conclusion), remplace=True)
         scene.wait(scene.INTERVALLE_LEGENDE*1.2)
         self.reduit_intervalle(scene)
         scene.wait(scene.INTERVALLE_LEGENDE)
@@ -140,22 +469,34 @@ class Tangente():
         self.vect_affiche = vect
         self.param = param
     
+    def marque(self, scene, couleur="#FFFFFF"):
+        """
+        Le point M(param), sans l'ajouter à la scène.
+        """
+        return Dot(
+            point=scene.repere.coords_to_point(*scene.courbe(self.param)),
+            color=couleur
+        ).scale(0.7)
+
+    def fleche(self, scene, couleur="#FFFFFF"):
+        """
+        Le vecteur directeur placé en M(param), sans l'ajouter à la scène.
+        """
+        return Arrow(
+            scene.repere.coords_to_point(*scene.courbe(self.param)),
+            scene.repere.coords_to_point(*(scene.courbe(self.param)) +  self.vect),
+            buff=0,
+            color=couleur
+        )
+
     def trace(self, scene, point=True, joue=True, couleur="#FFFFFF"):
         # scene est une instance de PasAPas
         
         if point:
-            pt_M = Dot(
-                point=scene.repere.coords_to_point(*scene.courbe(self.param)),
-                color=couleur
-            ).scale(0.7)
+            pt_M = self.marque(scene, couleur)
             scene.groupe_repere.add(pt_M)
             scene.add(pt_M)
-        vect = Arrow(
-            scene.repere.coords_to_point(*scene.courbe(self.param)),
-            scene.repere.coords_to_point(*(scene.courbe(self.param)) +  self.vect),
-            buff=0,
-            color=couleur
-        )
+        vect = self.fleche(scene, couleur)
         scene.groupe_repere.add(vect)
         if joue:
             scene.play(FadeIn(vect))
@@ -311,6 +652,376 @@ class Droite():
             color=couleur)
 
 
+class Cinematique():
+    """
+    Points en mouvement pilotés par un même ValueTracker, avec leurs
+    étiquettes et des segments qui les relient.
+
+    Une seule fonction de mise à jour calcule à chaque image la position de
+    chaque point une seule fois, puis déplace les points et leurs étiquettes
+    par translation et réécrit sur place les points des segments.
+    Contrairement à always_redraw et next_to, rien n'est recréé ni aucune
+    boîte englobante recalculée.
+
+    Elle est attachée au premier point et à chaque segment, et ne travaille
+    qu'une fois par valeur du paramètre. Les segments, placés avant les
+    points dans :meth:`mobjects` pour être dessinés dessous, ont ainsi un
+    updater : manim ne les met pas dans l'image de fond fixe pendant
+    l'animation.
+
+    :param parametre: le ValueTracker qui pilote le mouvement.
+
+    Exemple ::
+
+        param = ValueTracker(0)
+        cinematique = Cinematique(param)
+        M = cinematique.point(
+            Dot(color=ORANGE),
+            lambda t: self.repere.c2p(*self.courbe(t)),
+            Tex("M"), UP
+        )
+        N = cinematique.point(Dot(), lambda t: self.repere.c2p(t, 0))
+        cinematique.segment(Line(color=ORANGE), M, N)
+        self.add(*cinematique.mobjects())
+        self.play(param.animate.set_value(1))
+    """
+
+    def __init__(self, parametre: ValueTracker):
+        self.parametre = parametre
+        self.points = [] # [point, position, étiquettes, centre]
+        self.segments = [] # (segment, centre de départ, centre d'arrivée, coefficients)
+        self._ecart = np.zeros(3)
+        self._valeur = None
+
+    def point(self, point: Mobject, position, etiquette=None, direction=UP) -> Mobject:
+        """
+        Ajoute un point dont la position est donnée par la fonction
+        `position` du paramètre (coordonnées dans la scène). L'étiquette
+        éventuelle est placée par rapport au point comme avec next_to, puis
+        le suit avec le même décalage.
+
+        Retourne le point.
+        """
+        centre = np.array(position(self.parametre.get_value()), dtype=float)
+        point.move_to(centre)
+        etiquettes = []
+        if etiquette is not None:
+            etiquette.next_to(point, direction)
+            etiquettes.append(etiquette)
+        if not self.points:
+            point.add_updater(self.met_a_jour)
+        self.points.append([point, position, etiquettes, centre])
+        return point
+
+    def segment(self, segment: Line, depart: Mobject, arrivee: Mobject) -> Line:
+        """
+        Relie deux points déjà ajoutés par un segment (Line ou
+        équivalent), dont les points sont réécrits sur place à chaque image.
+
+        Retourne le segment.
+        """
+        centres = {id(p[0]): p[3] for p in self.points}
+        a, b = centres[id(depart)], centres[id(arrivee)]
+        segment.put_start_and_end_on(a, b)
+        coefficients = np.linspace(0, 1, len(segment.points))[:, np.newaxis]
+        self.segments.append((segment, a, b, coefficients))
+        self._ecrit_segment(*self.segments[-1])
+        segment.add_updater(self.met_a_jour)
+        return segment
+
+    def _ecrit_segment(self, segment, a, b, coefficients):
+        points = segment.points
+        np.subtract(b, a, out=self._ecart)
+        np.multiply(coefficients, self._ecart, out=points)
+        points += a
+
+    def met_a_jour(self, *args):
+        t = self.parametre.get_value()
+        if t == self._valeur:
+            return
+        self._valeur = t
+        for point, position, etiquettes, centre in self.points:
+            nouveau = position(t)
+            np.subtract(nouveau, centre, out=self._ecart)
+            point.shift(self._ecart)
+            for etiquette in etiquettes:
+                etiquette.shift(self._ecart)
+            centre[:] = nouveau
+        for segment in self.segments:
+            self._ecrit_segment(*segment)
+
+    def mobjects(self) -> list:
+        """
+        Tous les objets à ajouter à la scène : segments, points et
+        étiquettes.
+        """
+        resultat = [segment[0] for segment in self.segments]
+        for point, _, etiquettes, _ in self.points:
+            resultat.append(point)
+            resultat.extend(etiquettes)
+        return resultat
+
+
+class TableCourbe():
+    """
+    Points de la courbe d'une scène, échantillonnés une seule fois sur un
+    intervalle de paramètres, avec leur abscisse curviligne cumulée.
+    Les positions intermédiaires sont ensuite interpolées dans cette table,
+    sans appel à `courbe` ni à `coords_to_point`.
+
+    :param scene: la scène, instance de :class:`PasAPas`, dont le repère est placé.
+    :param t_debut:
+    :param t_fin: les bornes de l'intervalle, dans l'ordre du parcours.
+    :param transforme: fonction appliquée au paramètre, la table décrit alors
+        M(transforme(t)).
+    :param projection: fonction optionnelle appliquée aux coordonnées, de
+        forme (3, n), avant le passage dans la scène. Par exemple
+        `lambda c: c*[[1], [0], [0]]` pour le projeté sur l'axe (Ox).
+    :param n: nombre de points de la table.
+
+    Si l'intervalle traverse une discontinuité de la scène ou un trou entre
+    ses intervalles de tracé (voir :meth:`PasAPas._traverse_trou`), ou un
+    point où la courbe n'est pas définie, la table décrit la corde entre
+    les deux extrémités : le point ne peut pas suivre la courbe à travers
+    un pôle. Une extrémité non définie lève une ValueError.
+    """
+
+    def __init__(self, scene, t_debut, t_fin, transforme=lambda t: t,
+                 projection=None, n=256):
+        self.t_debut = t_debut
+        self.t_fin = t_fin
+        self.ts = np.linspace(t_debut, t_fin, n)
+        coords = scene._evalue_courbe(self.ts, transforme)
+        if projection is not None:
+            coords = projection(coords)
+        self.points = scene._vers_repere(coords)
+        if not np.isfinite(self.points[[0, -1]]).all():
+            raise ValueError(
+                f"M({t_debut}) ou M({t_fin}) n'est pas défini, impossible de s'y placer"
+            )
+        parametres = np.vectorize(transforme, otypes=[float])(self.ts)
+        coupee = scene._traverse_trou(parametres.min(), parametres.max())
+        if coupee or not np.isfinite(self.points).all():
+            self.points = np.linspace(self.points[0], self.points[-1], n)
+        longueurs = np.linalg.norm(np.diff(self.points, axis=0), axis=1)
+        self.abscisses = np.concatenate([[0], np.cumsum(longueurs)])
+
+    @property
+    def longueur(self) -> float:
+        return self.abscisses[-1]
+
+    def _point(self, u):
+        # u est un indice fractionnaire dans la table
+        i = min(max(int(u), 0), len(self.points) - 2)
+        f = u - i
+        return self.points[i] + f*(self.points[i + 1] - self.points[i])
+
+    def au_parametre(self, t):
+        """
+        Point de paramètre t, interpolé dans la table.
+        """
+        if self.t_fin == self.t_debut:
+            return self.points[0].copy()
+        return self._point(
+            (t - self.t_debut)/(self.t_fin - self.t_debut)*(len(self.points) - 1)
+        )
+
+    def a_la_fraction(self, alpha, vitesse_constante=False):
+        """
+        Point atteint à la fraction alpha du parcours : du paramètre si
+        `vitesse_constante` est faux, de la longueur parcourue sinon
+        (recherche dichotomique dans les abscisses curvilignes).
+        """
+        if not vitesse_constante or self.longueur == 0:
+            return self._point(alpha*(len(self.points) - 1))
+        s = alpha*self.longueur
+        i = int(np.searchsorted(self.abscisses, s, side="right")) - 1
+        i = min(max(i, 0), len(self.points) - 2)
+        ecart = self.abscisses[i + 1] - self.abscisses[i]
+        return self._point(i + ((s - self.abscisses[i])/ecart if ecart > 0 else 0))
+
+
+class MoveAlongCourbe(Animation):
+    """
+    Déplace un objet le long de la courbe de la scène, de M(t_debut) à
+    M(t_fin), en suivant la courbe et non la corde. L'objet doit être placé
+    en M(t_debut) au départ ; il est translaté à chaque image, ses
+    éventuelles étiquettes (dans un même Group) suivent donc.
+
+    La courbe n'est évaluée qu'une fois, dans une :class:`TableCourbe`.
+
+    :param mobject: l'objet à déplacer.
+    :param scene: la scène, instance de :class:`PasAPas`.
+    :param t_debut:
+    :param t_fin: les paramètres de départ et d'arrivée.
+    :param vitesse_constante: si vrai, parcours à vitesse constante le long
+        de la courbe, sinon à vitesse constante en t.
+    :param transforme:
+    :param projection: voir :class:`TableCourbe`.
+
+    Les autres arguments sont ceux d'Animation (run_time, rate_func...).
+    """
+
+    def __init__(self, mobject, scene, t_debut, t_fin, vitesse_constante=False,
+                 transforme=lambda t: t, projection=None, **kwargs):
+        self.table = TableCourbe(scene, t_debut, t_fin, transforme, projection)
+        self.vitesse_constante = vitesse_constante
+        self._position = self.table.points[0].copy()
+        super().__init__(mobject, **kwargs)
+
+    def begin(self):
+        self._position = self.table.points[0].copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        point = self.table.a_la_fraction(self.rate_func(alpha), self.vitesse_constante)
+        self.mobject.shift(point - self._position)
+        self._position = point
+
+
+class CreationCurviligne(Create):
+    """
+    Create à vitesse constante le long du tracé : la fraction alpha de
+    l'animation correspond à la même fraction de la longueur à l'écran, et
+    non du nombre de courbes de Bézier (donc des paramètres échantillonnés).
+
+    Les longueurs cumulées des courbes, mesurées sur leurs cordes une fois
+    ramenées au cadre (une branche hors de l'écran ne prend pas de temps),
+    sont calculées une fois. À chaque image, une recherche dichotomique
+    donne la courbe en cours de tracé : seule celle-ci est recalculée, les
+    précédentes étant une vue sur les points complets.
+    """
+
+    def __init__(self, mobject: VMobject, **kwargs):
+        super().__init__(mobject, **kwargs)
+        self._complets = mobject.points
+        self._n = mobject.n_points_per_cubic_curve
+        self._courbes = self._complets.reshape(-1, self._n, 3)
+        cadre = np.array([config.frame_width / 2, config.frame_height / 2])
+        extremites = np.clip(self._courbes[:, [0, -1], :2], -cadre, cadre)
+        longueurs = np.linalg.norm(extremites[:, 1] - extremites[:, 0], axis=1)
+        self._abscisses = np.concatenate([[0], np.cumsum(longueurs)])
+        self._tampon = self._complets.copy()
+        self._modifiee = None # indice de la courbe partielle dans le tampon
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        longueur = self._abscisses[-1]
+        if longueur == 0:
+            super().interpolate_mobject(alpha)
+            return
+        if alpha >= 1:
+            self.mobject.points = self._complets
+            return
+        s = alpha*longueur
+        k = int(np.searchsorted(self._abscisses, s, side="right")) - 1
+        k = min(max(k, 0), len(self._courbes) - 1)
+        ecart = self._abscisses[k + 1] - self._abscisses[k]
+        fraction = (s - self._abscisses[k])/ecart if ecart > 0 else 1
+        n = self._n
+        if self._modifiee is not None:
+            i = self._modifiee
+            self._tampon[i*n:(i + 1)*n] = self._complets[i*n:(i + 1)*n]
+        self._tampon[k*n:(k + 1)*n] = partial_bezier_points(self._courbes[k], 0, fraction)
+        self._modifiee = k
+        self.mobject.points = self._tampon[:(k + 1)*n]
+
+
+class TransformationGroupe(Animation):
+    """
+    Applique à tout un groupe la transformation affine p -> matrice·p + vecteur,
+    avec le même déroulé que `.animate` sur chacun de ses éléments (chaque
+    point va en ligne droite vers son image), mais en une seule animation.
+
+    Les points de tous les objets du groupe sont mis bout à bout dans un
+    tableau unique, dont chaque objet reçoit une vue : une image ne coûte
+    qu'une opération sur ce tableau, sans copie des objets.
+
+    Les flèches (Arrow) ne se transforment pas comme leurs points : par
+    exemple Arrow.scale garde la taille de la pointe et recalcule
+    l'épaisseur du trait d'après la longueur. Si `applique` est donné,
+    l'image de chaque flèche est obtenue en l'appliquant à une copie de
+    la flèche, et son épaisseur est interpolée, comme avec `.animate`.
+
+    :param mobject: le groupe à transformer.
+    :param matrice: matrice 3×3, l'identité par défaut.
+    :param vecteur: translation, nulle par défaut.
+    :param applique: fonction qui applique la même transformation à un
+        objet par ses propres méthodes (shift, scale...).
+    """
+
+    def __init__(self, mobject: Mobject, matrice=None, vecteur=ORIGIN,
+                 applique=None, **kwargs):
+        super().__init__(mobject, **kwargs)
+        self.matrice = np.identity(3) if matrice is None else np.asarray(matrice, dtype=float)
+        self.vecteur = np.asarray(vecteur, dtype=float)
+        self.applique = applique
+
+    @classmethod
+    def translation(cls, mobject, vecteur, **kwargs):
+        # une translation n'a pas de cas particulier
+        return cls(mobject, vecteur=vecteur, **kwargs)
+
+    @classmethod
+    def homothetie(cls, mobject, rapport, centre=ORIGIN, **kwargs):
+        centre = np.asarray(centre, dtype=float)
+        return cls(
+            mobject, rapport*np.identity(3), (1 - rapport)*centre,
+            applique=lambda m: m.scale(rapport, about_point=centre),
+            **kwargs
+        )
+
+    def create_starting_mobject(self) -> Mobject:
+        # les points de départ sont conservés dans begin
+        return Mobject()
+
+    def begin(self):
+        self._objets = [m for m in self.mobject.get_family() if len(m.points) > 0]
+        self._depart = np.concatenate(
+            [m.points for m in self._objets] or [np.zeros((0, 3))]
+        ).astype(float)
+        arrivee = self._depart @ self.matrice.T + self.vecteur
+        bornes = {}
+        debut = 0
+        for m in self._objets:
+            bornes[id(m)] = (debut, debut + len(m.points))
+            debut += len(m.points)
+        self._epaisseurs = [] # (objet, épaisseur de départ, d'arrivée)
+        if self.applique is not None:
+            for fleche in self.mobject.get_family():
+                if not isinstance(fleche, Arrow):
+                    continue
+                cible = fleche.copy()
+                self.applique(cible)
+                for m, image in zip(fleche.get_family(), cible.get_family()):
+                    if id(m) in bornes and len(image.points) == len(m.points):
+                        debut, fin = bornes[id(m)]
+                        arrivee[debut:fin] = image.points
+                    if image.get_stroke_width() != m.get_stroke_width():
+                        self._epaisseurs.append(
+                            (m, m.get_stroke_width(), image.get_stroke_width())
+                        )
+        self._ecart = arrivee - self._depart
+        self._tampon = self._depart.copy()
+        for m in self._objets:
+            debut, fin = bornes[id(m)]
+            m.points = self._tampon[debut:fin]
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        np.multiply(self._ecart, alpha, out=self._tampon)
+        self._tampon += self._depart
+        for m, depart, arrivee in self._epaisseurs:
+            m.set_stroke(width=depart + alpha*(arrivee - depart), family=False)
+
+    def finish(self):
+        super().finish()
+        # chaque objet retrouve ses propres points
+        for m in self._objets:
+            m.points = m.points.copy()
+
+
 class BrancheInfinie(abc.ABC):
     """
     Classe abstraite, de base pour toutes les branches infinies.
@@ -482,6 +1193,28 @@ class PasAPas(Scene):
             le fait manim de base. Ce rendu peut être non symétrique
             et l'animation peut varier en vitesse si les intervalles
             de tracé ne sont pas de même longueur.
+
+    .. py:attribute:: VECTORISE
+        :type: bool
+        :value: True
+
+        Évalue la courbe sur un tableau de paramètres en un seul appel à
+        :meth:`courbe`, puis passe dans le repère par une unique opération
+        affine. Si :meth:`x` ou :meth:`y` n'acceptent pas de np.array, on
+        revient automatiquement à une évaluation point par point.
+
+    .. py:attribute:: TOLERANCE_PIXELS
+        :type: float
+        :value: 0.5
+
+        Écart maximal, en pixels, entre la courbe et la ligne brisée tracée.
+        L'échantillonnage est adaptatif : voir :func:`echantillonne`.
+
+    .. py:attribute:: BUDGET_POINTS
+        :type: int
+        :value: 2000
+
+        Nombre maximal de points utilisés pour chaque morceau de courbe.
     
     Les étapes de la construction
     -----------------------------
@@ -504,6 +1237,7 @@ class PasAPas(Scene):
 
         Une liste de même longueur que ::attr:`PARAMS` qui donne les
         objets manim texte à afficher comme explication à droite du repère.
+        Ils peuvent être donnés sous forme différée, voir :class:`Differe`.
     
     .. py:attribute:: LEGENDES
         :type: list
@@ -565,6 +1299,95 @@ class PasAPas(Scene):
         :value: False
 
         Ne génére pas la partie étude de courbe, mais seulement la partie tracé.
+
+    .. py:attribute:: PRECOMPILE_TEX
+        :type: bool
+        :value: True
+
+        Avant le rendu, exécute :meth:`construct` à blanc pour relever tous
+        les textes LaTeX, puis les compile en parallèle dans le cache disque
+        (voir :meth:`precompile_tex`).
+
+    .. py:attribute:: PROCESSUS_TEX
+        :type: int
+        :value: None
+
+        Nombre de processus pour la précompilation, par défaut le nombre
+        de cœurs.
+
+    .. py:attribute:: PROFILAGE
+        :type: bool
+        :value: False
+
+        Relève le temps passé dans chaque section (construction, LaTeX,
+        animation, rendu, écriture), le nombre d'images et d'objets.
+        Le rapport est écrit en JSON dans `<media_dir>/profils` (ou dans le
+        dossier donné par la variable d'environnement `COURBES_PROFILAGE`,
+        qui active aussi le profilage, sauf si elle vaut `0`) et résumé
+        dans le journal. Le rapport couvre aussi l'assemblage final de la
+        vidéo, après :meth:`tear_down`.
+
+    .. py:attribute:: SECTION_RENDUE
+        :type: int
+        :value: None
+
+        Si ce n'est pas None, seule la section de cet indice est rendue : les
+        animations des sections précédentes sont jouées sans produire
+        d'image, pour retrouver l'état de la scène, et le rendu s'arrête à la
+        fin de la section. La section 0 est ce qui précède le premier appel à
+        :meth:`next_section`. Utilisé par :mod:`rendu_sections` pour rendre
+        les sections en parallèle.
+
+    .. py:attribute:: BROUILLON
+        :type: float
+        :value: 1.0
+
+        Facteur appliqué à la durée de toutes les animations et attentes,
+        y compris celles de :meth:`Symetrie.play` et :meth:`Tangente.trace`.
+        En dessous de 1, les attentes sans mise à jour d'objet sont réduites
+        à une seule image : un brouillon garde toute la structure des
+        épisodes avec une fraction des images. La variable d'environnement
+        `COURBES_BROUILLON` est prioritaire.
+
+    .. py:attribute:: FUSION_TEXTES
+        :type: bool
+        :value: True
+
+        Les apparitions et disparitions de textes (:meth:`affiche_texte`,
+        :meth:`efface_textes`, :meth:`annonce_episode`) qui se suivent sans
+        autre animation ni attente entre elles sont jouées en un seul appel
+        à play (une Succession), avec le même déroulé. Chaque play produit
+        un fichier vidéo partiel : il y en a ainsi beaucoup moins.
+
+    .. py:attribute:: FOND_FIGE
+        :type: bool
+        :value: True
+
+        Pendant une animation, manim dessine une fois les objets fixes dans
+        une image de fond, puis seulement les objets mobiles à chaque image.
+        Avec cet attribut, les éléments non animés de `groupe_repere`
+        restent toujours dans ce fond, et l'image de fond est réutilisée
+        d'une animation à l'autre tant que les objets fixes n'ont pas changé.
+        Pendant les épisodes où seuls les textes de droite changent, le
+        repère n'est ainsi dessiné qu'une fois (renderer Cairo seulement).
+
+    .. py:attribute:: TRACE_CURVILIGNE
+        :type: bool
+        :value: True
+
+        Les morceaux de courbe sont tracés à vitesse constante à l'écran
+        (:class:`CreationCurviligne`) au lieu d'avancer avec le paramètre
+        comme Create : près d'un pôle, la courbe ne part plus hors de
+        l'écran en quelques images pour ensuite se traîner.
+
+    .. py:attribute:: TOLERANCE_TANGENTES
+        :type: float
+        :value: 1e-6
+
+        Lors du tracé complet, les images par symétrie des tangentes qui
+        coïncident, à cette distance près, avec une flèche déjà tracée
+        (même point, même direction et même sens) ne sont pas tracées à
+        nouveau.
     """
 
     SKIP = False # devons nous passer directement au tracé
@@ -599,15 +1422,417 @@ class PasAPas(Scene):
     # - Utiliser DISCONTINUITES et DT comme le fait manim de base. Ce rendu peut être
     # non symétrique et l'animation peut varier en vitesse si les intervalles de tracé
     # ne sont pas de même longueur
-    
+    PRECOMPILE_TEX = True # compilation parallèle des textes avant le rendu
+    PROCESSUS_TEX = None # nombre de processus pour cette compilation
+    VECTORISE = True # évaluation de la courbe sur des tableaux de paramètres
+    TOLERANCE_PIXELS = 0.5 # écart maximal entre la courbe et son tracé
+    BUDGET_POINTS = 2000 # nombre maximal de points par morceau de courbe
+    PROFILAGE = False # relevé des temps par section
+    SECTION_RENDUE = None # indice de la seule section à rendre
+    BROUILLON = 1.0 # facteur des durées, < 1 pour un aperçu rapide
+    FUSION_TEXTES = True # transitions de textes successives en un seul play
+    FOND_FIGE = True # image du repère réutilisée tant qu'il ne change pas
+    TRACE_CURVILIGNE = True # tracé des courbes à vitesse constante
+    TOLERANCE_TANGENTES = 1e-6 # écart sous lequel deux tangentes coïncident
+    # déplacement et agrandissement du repère à la fin du tracé complet
+    DECALAGE_FINAL = RIGHT*3
+    ECHELLE_FINALE = 1.2
+
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self._initialise_etat()
+
+    def _initialise_etat(self):
+        """
+        État propre à la construction, indépendant de manim.
+        """
+        self._enregistrement = False
         self.textes_courrants = []
         self.groupe_repere = Group()
         self.repere_affiche = False
         self._num_episode = 0
+        self._courbe_vectorisable = True
+        self._echantillons = [] # (ts, coordonnées) des morceaux déjà tracés
+        self._profileur = None
+        self._sections = [] # noms des sections déjà commencées
+        self._codes_sections = [] # (état initial, codes exécutés, fichiers lus, premier texte) par section
+        self._textes = [] # textes LaTeX relevés pendant le passage à blanc
+        self._chronologie = None # relevé des animations du passage à blanc
+        self._transitions = [] # transitions de textes en attente
     
+    def setup(self):
+        super().setup()
+        # caches et formats LaTeX, retirés par tear_down
+        tc.active_caches()
+        variable = os.environ.get("COURBES_PROFILAGE", "")
+        if variable != "0" and (self.PROFILAGE or variable):
+            self._profileur = Profileur(self)
+            self._profileur.installe()
+        if self.PRECOMPILE_TEX and tc.cache_tex is not None:
+            if self._profileur is not None:
+                self._profileur.section("Précompilation LaTeX")
+            self.precompile_tex()
+        if self.FOND_FIGE and hasattr(self.renderer, "save_static_frame_data"):
+            self.renderer.save_static_frame_data = self._fond_fige(
+                self.renderer.save_static_frame_data
+            )
+        if self.SECTION_RENDUE is not None:
+            # section 0 : ce qui précède le premier appel à next_section
+            super().next_section("Début", skip_animations=self.SECTION_RENDUE != 0)
+
+    def tear_down(self):
+        self._vide_transitions()
+        super().tear_down()
+        tc.desactive_caches()
+        if self._profileur is not None:
+            self._profileur.section("Finalisation")
+
+    def render(self, *args, **kwargs):
+        # le profil n'est écrit qu'après l'assemblage de la vidéo par le
+        # renderer, qui suit tear_down
+        resultat = super().render(*args, **kwargs)
+        if self._profileur is not None:
+            self._profileur.termine()
+            file_writer = getattr(self.renderer, "file_writer", None)
+            self._profileur.video = str(getattr(file_writer, "movie_file_path", "") or "")
+            self._profileur.images_par_seconde = config.frame_rate
+            dossier = os.environ.get("COURBES_PROFILAGE")
+            if not dossier or dossier == "1":
+                dossier = Path(config.media_dir) / "profils"
+            chemin = self._profileur.ecrit(Path(dossier) / f"{type(self).__name__}.json")
+            logger.info(f"Profil de rendu ({chemin}) :\n{self._profileur.tableau()}")
+        return resultat
+
+    @classmethod
+    def passage_a_blanc(cls, empreintes=False, chronologie=None):
+        """
+        Exécute :meth:`construct` sur une instance sans renderer, sans rendu
+        ni compilation LaTeX.
+
+        Retourne la liste des textes LaTeX demandés (triplets expression,
+        environnement, template) et la liste des noms de sections passés à
+        :meth:`next_section`. Si la construction échoue en cours de route,
+        retourne les textes relevés jusque là et None pour les sections.
+
+        Si `empreintes` est vrai, retourne en plus l'empreinte de chaque
+        section, section 0 comprise (voir :meth:`_empreintes_sections`), ou
+        None en cas d'échec. Les animations sont alors menées à leur état
+        final, sans aucune image, et la liste des objets affichés est tenue
+        à jour comme pendant le rendu (voir :meth:`_joue_a_blanc`).
+
+        Si une :class:`chronologie.Chronologie` est donnée, elle relève les
+        appels à play et wait.
+        """
+        enregistreur = cls.__new__(cls)
+        enregistreur._initialise_etat()
+        enregistreur._enregistrement = True
+        enregistreur._chronologie = chronologie
+        enregistreur.mobjects = [] # objets affichés, comme Scene.mobjects
+        sections = None
+        def trace(frame, evenement, arg):
+            if evenement == "call":
+                enregistreur._codes_sections[-1][1].add(frame.f_code)
+        with tc.EnregistreurTex() as entrees:
+            enregistreur._textes = entrees
+            try:
+                if empreintes:
+                    enregistreur._debut_section()
+                    sys.setprofile(trace)
+                enregistreur.construct()
+                sections = enregistreur._sections
+            except Exception as e:
+                logger.info(f"Enregistrement des textes interrompu : {e!r}")
+            finally:
+                if empreintes:
+                    sys.setprofile(None)
+                    _suit_lectures(None)
+        if not empreintes:
+            return entrees, sections
+        if sections is None:
+            return entrees, None, None
+        return entrees, sections, enregistreur._empreintes_sections()
+
+    @classmethod
+    def chronologie(cls) -> Chronologie:
+        """
+        Chronologie de la vidéo sans aucun rendu : pour chaque animation ou
+        attente, sa section, son début, sa durée, les types d'animations et
+        le nombre d'objets animés et affichés. Voir :mod:`chronologie` pour
+        l'estimation du temps de rendu.
+        """
+        chronologie = Chronologie(config.frame_rate)
+        cls.passage_a_blanc(chronologie=chronologie)
+        return chronologie
+
+    def _empreinte_etat(self) -> str:
+        """
+        Empreinte de l'état de la scène transmis d'une section à la suivante :
+        attributs de la construction et objets affichés (avec toute leur
+        famille), dans l'état où les ont laissés les animations précédentes.
+        """
+        h = hashlib.sha256()
+        empreinte([
+            self.repere_affiche,
+            self._num_episode,
+            getattr(self, "repere", None),
+            self.groupe_repere,
+            self.textes_courrants,
+            self.mobjects
+        ], h)
+        return h.hexdigest()
+
+    def _debut_section(self):
+        # pendant le passage à blanc avec empreintes : état à l'entrée de la
+        # section, codes exécutés et fichiers lus dans la section, indice de
+        # son premier texte LaTeX
+        fichiers = set()
+        self._codes_sections.append((self._empreinte_etat(), set(), fichiers, len(self._textes)))
+        _suit_lectures(fichiers)
+
+    def _empreintes_sections(self) -> list:
+        """
+        Empreinte de chaque section relevée par le passage à blanc : elle
+        dépend de l'état de la scène au début de la section, du code des
+        fonctions exécutées pendant la section (méthodes de la scène,
+        fonctions de ce module, lambdas des symétries...), des attributs
+        de classe en majuscules que ce code utilise (SYMETRIES, P_RANGE,
+        INTERVALLE_LEGENDE...), du contenu des fichiers lus pendant la
+        section (tableaux de variations...) et des templates LaTeX de ses
+        textes.
+
+        Deux rendus d'une section de même empreinte produisent la même vidéo.
+        """
+        dossiers = {Path(__file__).resolve().parent}
+        fichier = getattr(sys.modules[type(self).__module__], "__file__", None)
+        if fichier is not None:
+            dossiers.add(Path(fichier).resolve().parent)
+        resultat = []
+        debuts = [debut for *_, debut in self._codes_sections[1:]] + [len(self._textes)]
+        for (etat, codes, fichiers, debut), fin in zip(self._codes_sections, debuts):
+            h = hashlib.sha256(etat.encode())
+            codes = sorted(
+                (code for code in codes if Path(code.co_filename).resolve().parent in dossiers),
+                key=lambda code: (code.co_filename, code.co_name, code.co_firstlineno)
+            )
+            attributs = set()
+            for code in codes:
+                h.update(code.co_name.encode())
+                empreinte(code, h)
+                attributs.update(nom for nom in code.co_names if nom.isupper())
+            for nom in sorted(attributs):
+                if hasattr(type(self), nom):
+                    h.update(nom.encode())
+                    empreinte(getattr(type(self), nom), h)
+            for fichier in sorted({Path(f).resolve() for f in fichiers}):
+                # les sources python sont déjà représentées par leur code
+                if fichier.parent in dossiers and fichier.suffix not in (".py", ".pyc") and fichier.is_file():
+                    h.update(fichier.name.encode())
+                    h.update(fichier.read_bytes())
+            templates = {
+                (str(template.tex_compiler), template.body)
+                for template in (
+                    texte[2] or config["tex_template"] for texte in self._textes[debut:fin]
+                )
+            }
+            empreinte(sorted(templates), h)
+            resultat.append(h.hexdigest())
+        return resultat
+
+    def precompile_tex(self):
+        """
+        Premier passage à blanc : exécute :meth:`construct` sans aucun rendu
+        ni compilation, en relevant tous les textes LaTeX demandés. Ceux-ci
+        sont ensuite compilés en parallèle dans le cache disque, et le vrai
+        rendu ne fait plus que les relire.
+
+        Le passage à blanc travaille sur une autre instance, sans renderer
+        (voir :meth:`passage_a_blanc`).
+        """
+        entrees, _ = self.passage_a_blanc()
+        logger.info(f"Précompilation de {len(entrees)} textes")
+        for erreur in tc.precompile(entrees, processus=self.PROCESSUS_TEX):
+            logger.info(f"Erreur de précompilation {erreur}")
+
+    # pendant l'enregistrement, ces méthodes ne produisent aucune image :
+    # elles alimentent l'éventuelle chronologie et, pour les empreintes des
+    # sections, tiennent à jour les objets affichés
+    def play(self, *args, **kwargs):
+        if not self._enregistrement:
+            self._vide_transitions()
+            args = self._accelere(args, kwargs)
+            super().play(*args, **kwargs)
+            return
+        animations = [prepare_animation(a) for a in args]
+        if self._chronologie is not None:
+            self._chronologie.joue(*animations, **kwargs)
+        if self._codes_sections:
+            self._joue_a_blanc(animations)
+
+    def _joue_a_blanc(self, animations):
+        """
+        Déroulé de Scene.play sans rendu : ajout des objets animés, début
+        et fin immédiate des animations (cibles de `.animate` et Transform
+        appliquées), retrait des objets des animations qui les retirent
+        (FadeOut...), puis une mise à jour des objets qui ont des updaters.
+        """
+        super().add_mobjects_from_animations(animations)
+        for animation in animations:
+            animation._setup_scene(self)
+            animation.begin()
+        for animation in animations:
+            animation.finish()
+            animation.clean_up_from_scene(self)
+        super().update_mobjects(0)
+
+    def get_mobject_family_members(self):
+        if not self._enregistrement:
+            return super().get_mobject_family_members()
+        return [m for mobject in self.mobjects for m in mobject.get_family()]
+
+    def wait(self, duration=DEFAULT_WAIT_TIME, *args, **kwargs):
+        if not self._enregistrement:
+            self._vide_transitions()
+            facteur = self.facteur_brouillon()
+            if facteur < 1 and not self.should_update_mobjects():
+                # image fixe : une seule suffit
+                duration = 1/config.frame_rate
+            else:
+                duration *= facteur
+            super().wait(duration, *args, **kwargs)
+        elif self._chronologie is not None:
+            self._chronologie.attend(duration, *args, **kwargs)
+
+    def add(self, *mobjects):
+        if not self._enregistrement:
+            self._vide_transitions()
+            return super().add(*mobjects)
+        if self._chronologie is not None:
+            self._chronologie.ajoute(*mobjects)
+        for mobject in mobjects:
+            if mobject in self.mobjects:
+                self.mobjects.remove(mobject)
+            self.mobjects.append(mobject)
+        return self
+
+    def remove(self, *mobjects):
+        if not self._enregistrement:
+            self._vide_transitions()
+            return super().remove(*mobjects)
+        if self._chronologie is not None:
+            self._chronologie.retire(*mobjects)
+        for mobject in mobjects:
+            if mobject in self.mobjects:
+                self.mobjects.remove(mobject)
+        return self
+
+    def next_section(self, name="unnamed", section_type=DefaultSectionType.NORMAL,
+                     skip_animations=False):
+        self._sections.append(name)
+        if self._enregistrement:
+            if self._codes_sections:
+                self._debut_section()
+            if self._chronologie is not None:
+                self._chronologie.section(name)
+            return
+        self._vide_transitions()
+        if self.SECTION_RENDUE is not None:
+            indice = len(self._sections)
+            if indice > self.SECTION_RENDUE:
+                # la section demandée est terminée
+                raise EndSceneEarlyException()
+            skip_animations = indice != self.SECTION_RENDUE
+        if self._profileur is not None:
+            self._profileur.section(name)
+        super().next_section(name, section_type, skip_animations)
+
+    def facteur_brouillon(self) -> float:
+        """
+        Facteur appliqué aux durées des animations et attentes, donné par
+        la variable d'environnement COURBES_BROUILLON ou à défaut par
+        :attr:`BROUILLON`. Lève ValueError s'il n'est pas strictement positif.
+        """
+        facteur = float(os.environ.get("COURBES_BROUILLON") or self.BROUILLON)
+        if not facteur > 0:
+            raise ValueError(f"Facteur de brouillon invalide : {facteur}")
+        return facteur
+
+    def _accelere(self, animations, kwargs):
+        """
+        Applique le facteur de brouillon aux animations passées à play.
+        Retourne les animations, kwargs est modifié sur place.
+
+        Le Wait joué par :meth:`wait` a déjà sa durée finale : il n'est pas
+        accéléré une seconde fois.
+        """
+        facteur = self.facteur_brouillon()
+        if facteur == 1 or all(isinstance(a, Wait) for a in animations):
+            return animations
+        if kwargs.get("run_time") is not None:
+            kwargs["run_time"] *= facteur
+            return animations
+        # mobject.animate(run_time=...) donne un constructeur d'animation
+        animations = [a.build() if hasattr(a, "build") else a for a in animations]
+        for animation in animations:
+            animation.run_time *= facteur
+        return animations
+
+    def get_moving_mobjects(self, *animations):
+        """
+        Comme manim, mais les éléments de `groupe_repere` qui ne sont ni
+        animés ni mis à jour restent dans le fond fixe, même s'ils ont été
+        ajoutés à la scène après un texte animé (voir :attr:`FOND_FIGE`).
+        """
+        mobiles = super().get_moving_mobjects(*animations)
+        if not self.FOND_FIGE or not mobiles:
+            return mobiles
+        animes = set()
+        a_voir = list(animations)
+        while a_voir:
+            animation = a_voir.pop()
+            if getattr(animation, "mobject", None) is not None:
+                animes.update(id(m) for m in animation.mobject.get_family())
+            a_voir.extend(getattr(animation, "animations", []))
+        figes = set()
+        for element in self.groupe_repere.submobjects:
+            famille = element.get_family()
+            if not any(id(m) in animes or m.updaters for m in famille):
+                figes.update(id(m) for m in famille)
+        return [m for m in mobiles if id(m) not in figes]
+
+    def _fond_fige(self, save_static_frame_data):
+        """
+        Enveloppe CairoRenderer.save_static_frame_data : l'image des objets
+        fixes n'est recalculée que si ces objets, ou l'un de leurs
+        sous-objets, ont changé depuis l'appel précédent (liste, géométrie,
+        couleurs).
+        """
+        fond = {"cle": None, "image": None}
+        def sauve(scene, static_mobjects):
+            static_mobjects = list(static_mobjects)
+            if not static_mobjects:
+                fond["cle"] = fond["image"] = None
+                return save_static_frame_data(scene, static_mobjects)
+            h = hashlib.blake2b(digest_size=16)
+            # Axes, VGroup, Tex... n'ont de points que dans leurs sous-objets
+            familles = (mobject.get_family() for mobject in static_mobjects)
+            for mobject in (m for famille in familles for m in famille):
+                h.update(id(mobject).to_bytes(8, "little"))
+                h.update(str(getattr(mobject, "z_index", 0)).encode())
+                for attribut in ("points", "fill_rgbas", "stroke_rgbas",
+                        "background_stroke_rgbas", "stroke_width", "pixel_array"):
+                    valeur = getattr(mobject, attribut, None)
+                    if valeur is not None:
+                        h.update(np.ascontiguousarray(valeur).tobytes())
+            cle = h.digest()
+            if cle == fond["cle"]:
+                self.renderer.static_image = fond["image"]
+                return fond["image"]
+            fond["image"] = save_static_frame_data(scene, static_mobjects)
+            fond["cle"] = cle
+            return fond["image"]
+        return sauve
+
     def x(self, t):
         """
         Fonction abscisse.
@@ -627,13 +1852,99 @@ class PasAPas(Scene):
             t-t,
         ])
 
+    def _evalue_courbe(self, ts, transforme=lambda t: t):
+        """
+        Évalue la courbe sur un tableau de paramètres.
+
+        Retourne un np.array de forme (3, len(ts)) contenant les coordonnées
+        des points M(transforme(t)). Si :attr:`VECTORISE` est faux, ou si
+        les fonctions fournies n'acceptent pas de tableau, l'évaluation se
+        fait point par point.
+        """
+        ts = np.asarray(ts, dtype=float)
+        if self.VECTORISE and self._courbe_vectorisable:
+            try:
+                coords = np.asarray(self.courbe(transforme(ts)), dtype=float)
+            except (TypeError, ValueError):
+                coords = None
+            if coords is not None and coords.shape == (3, len(ts)):
+                return coords
+            # inutile de réessayer pour les prochains morceaux
+            self._courbe_vectorisable = False
+            logger.info("Courbe non vectorisable, évaluation point par point")
+        return np.array(
+            [self.courbe(transforme(t)) for t in ts], dtype=float
+        ).reshape(-1, 3).T
+
+    def _affine_repere(self):
+        """
+        Les axes étant linéaires, coords_to_point est une application affine.
+        Retourne le couple (origine, matrice) qui la décrit, où les lignes de
+        matrice sont les images des vecteurs de base.
+        """
+        origine = np.asarray(self.repere.coords_to_point(0, 0, 0), dtype=float)
+        matrice = np.array([
+            self.repere.coords_to_point(1, 0, 0),
+            self.repere.coords_to_point(0, 1, 0)
+        ], dtype=float) - origine
+        return origine, matrice
+
+    def _vers_repere(self, coords):
+        """
+        Passe d'un tableau de coordonnées de forme (3, n) aux points de la
+        scène, sous forme d'un np.array de forme (n, 3), en une seule
+        opération affine.
+        """
+        origine, matrice = self._affine_repere()
+        return origine + np.asarray(coords)[:2].T @ matrice
+
+    def _depuis_repere(self, points):
+        """
+        Opération inverse de :meth:`_vers_repere`.
+        """
+        origine, matrice = self._affine_repere()
+        coords = (np.asarray(points) - origine) @ np.linalg.pinv(matrice)
+        return np.vstack([coords.T, np.zeros(len(coords))])
+
+    def _joue_transition(self, *animations, vide=False):
+        """
+        Joue les animations ensemble, comme play, mais si
+        :attr:`FUSION_TEXTES` est vrai les met en attente : les transitions
+        successives sont jouées en un seul appel à play, par une
+        Succession de même durée totale (voir :meth:`_vide_transitions`).
+
+        :param vide: si vrai, joue aussitôt les transitions en attente,
+            celle-ci comprise.
+        """
+        if not self.FUSION_TEXTES or self._enregistrement or not animations:
+            self.play(*animations)
+            return
+        self._transitions.append(
+            animations[0] if len(animations) == 1 else AnimationGroup(*animations)
+        )
+        if vide:
+            self._vide_transitions()
+
+    def _vide_transitions(self):
+        """
+        Joue les transitions en attente. Appelée avant toute autre
+        animation, attente, modification des objets de la scène ou
+        changement de section.
+        """
+        if self._transitions:
+            transitions, self._transitions = self._transitions, []
+            if len(transitions) == 1:
+                self.play(transitions[0])
+            else:
+                self.play(Succession(*transitions))
+
     def efface_textes(self):
         """
         Efface tous les textes courrants.
         """
         # une animation pour tout effacer
         if self.textes_courrants:
-            self.play(*[FadeOut(txt) for txt in self.textes_courrants])
+            self._joue_transition(*[FadeOut(txt) for txt in self.textes_courrants])
         self.textes_courrants = []
     
     def affiche_texte(self, *textes, remplace=True):
@@ -650,7 +1961,7 @@ class PasAPas(Scene):
         else:
             self.textes_courrants.extend(textes)
         # affichage de tous les nouveaux textes
-        self.play(*[FadeIn(txt) for txt in textes])
+        self._joue_transition(*[FadeIn(txt) for txt in textes])
     
     def cache_repere(self, joue=True):
         """
@@ -662,7 +1973,8 @@ class PasAPas(Scene):
         if self.repere_affiche:
             self.repere_affiche = False
             if joue:
-                self.play(FadeOut(self.groupe_repere))
+                # groupe_repere peut encore changer : pas d'attente
+                self._joue_transition(FadeOut(self.groupe_repere), vide=True)
             else:
                 return FadeOut(self.groupe_repere)
     
@@ -695,16 +2007,17 @@ class PasAPas(Scene):
         self.cache_repere()
         num = Tex(f"Épisode {numero}").move_to(UP)
         titre_txt = Tex(titre).next_to(num, DOWN)
-        self.play(FadeIn(num), FadeIn(titre_txt))
+        self._joue_transition(FadeIn(num), FadeIn(titre_txt))
         self.wait(self.INTERVALLE_LEGENDE)
         if repere_fin and not self.repere_affiche:
-            self.play(
+            self._joue_transition(
                 FadeOut(num),
                 FadeOut(titre_txt),
-                self.affiche_repere(joue=False)
+                self.affiche_repere(joue=False),
+                vide=True
             )
         else:
-            self.play(FadeOut(num), FadeOut(titre_txt))
+            self._joue_transition(FadeOut(num), FadeOut(titre_txt))
         self._num_episode += 1
 
     
@@ -742,34 +2055,32 @@ class PasAPas(Scene):
             self.play(FadeIn(warn_gpe))
             for i, t in enumerate(parametres):
                 if textes is not None:
-                    txt = textes[i]
+                    txt = materialise(textes[i])
                     self.affiche_texte(txt)
                     self.wait(self.INTERVALLE_LEGENDE)
                 if i == 0:
                     px = Dot(point=self.repere.coords_to_point(self.x(t), 0, 0))
-                    txt_x = Text(f"x({t})").next_to(px, legendes[i]["x"]).scale(0.5)
+                    txt_x = interne(Text, f"x({t})").next_to(px, legendes[i]["x"]).scale(0.5)
                     py = Dot(point=self.repere.coords_to_point(0, self.y(t), 0))
-                    txt_y = Text(f"y({t})").next_to(py, legendes[i]["y"]).scale(0.5)
+                    txt_y = interne(Text, f"y({t})").next_to(py, legendes[i]["y"]).scale(0.5)
                     pM = Dot(point=self.repere.coords_to_point(*self.courbe(t)))
-                    txt_M = Text(f"M({t})").next_to(pM, legendes[i]["M"]).scale(0.7)
+                    txt_M = interne(Text, f"M({t})").next_to(pM, legendes[i]["M"]).scale(0.7)
                     self.add(px, py, pM)
                     self.add(txt_x, txt_y, txt_M)
                 else:
                     self.play(FadeOut(txt_x), FadeOut(txt_y), FadeOut(txt_M))
+                    # M suit la courbe, ses projetés restent synchronisés
+                    t_prec = parametres[i - 1]
                     self.play(
-                        px.animate.move_to(
-                            self.repere.coords_to_point(self.x(t), 0, 0)
-                        ),
-                        py.animate.move_to(
-                            self.repere.coords_to_point(0, self.y(t), 0)
-                        ),
-                        pM.animate.move_to(
-                            self.repere.coords_to_point(*self.courbe(t))
-                        )
+                        MoveAlongCourbe(px, self, t_prec, t,
+                            projection=lambda c: c*[[1], [0], [0]]),
+                        MoveAlongCourbe(py, self, t_prec, t,
+                            projection=lambda c: c*[[0], [1], [0]]),
+                        MoveAlongCourbe(pM, self, t_prec, t)
                     )
-                    txt_x = Text(f"x({t})").next_to(px, legendes[i]["x"]).scale(0.5)
-                    txt_y = Text(f"y({t})").next_to(py, legendes[i]["y"]).scale(0.5)
-                    txt_M = Text(f"M({t})").next_to(pM, legendes[i]["M"]).scale(0.7)
+                    txt_x = interne(Text, f"x({t})").next_to(px, legendes[i]["x"]).scale(0.5)
+                    txt_y = interne(Text, f"y({t})").next_to(py, legendes[i]["y"]).scale(0.5)
+                    txt_M = interne(Text, f"M({t})").next_to(pM, legendes[i]["M"]).scale(0.7)
                     self.add(txt_x, txt_y, txt_M)
                 self.wait(self.INTERVALLE_LEGENDE)
             self.wait(self.INTERVALLE_LEGENDE)
@@ -830,11 +2141,13 @@ class PasAPas(Scene):
     def points_reguliers(self):
         if len(self.POINTS_REGULIERS) > 0:
             self.cache_repere()
-            txt1 = Tex(
+            txt1 = interne(
+                Tex,
                 "S'il est non nul, le vecteur $\\frac{\\text{d}\\overrightarrow{OM}}{\\text{d}t}(t_0)$"
             ).move_to(UP*3)
-            txt2 = Tex("dirige la tangente à l'instant $t_0$.").next_to(txt1, DOWN)
-            txt3 = Tex(
+            txt2 = interne(Tex, "dirige la tangente à l'instant $t_0$.").next_to(txt1, DOWN)
+            txt3 = interne(
+                Tex,
                 "Il s'agit du vecteur vitesse instantanée."
             ).next_to(txt2, DOWN)
             self.affiche_texte(txt1, txt2)
@@ -849,7 +2162,7 @@ class PasAPas(Scene):
             pt_M = Dot(
                 point=self.repere.coords_to_point(*self.courbe(t0))
             ).scale(0.7)
-            txt_M = Tex(f"M({txt_t0})").next_to(pt_M, UP/2).scale(0.5)
+            txt_M = interne(Tex, f"M({txt_t0})").next_to(pt_M, UP/2).scale(0.5)
             self.groupe_repere.add(pt_M)
             self.play(FadeIn(pt_M))
             self.play(FadeIn(txt_M))
@@ -920,24 +2233,226 @@ class PasAPas(Scene):
         """
         return
 
+    def _traverse_trou(self, t_min, t_max) -> bool:
+        """
+        Vrai si [t_min, t_max] contient un paramètre de :attr:`DISCONTINUITES`,
+        ou, lorsque :attr:`P_RANGE` est une liste d'intervalles, n'est contenu
+        dans aucun d'eux (il enjambe un pôle exclu du tracé).
+        """
+        if any(t_min <= d <= t_max for d in self.DISCONTINUITES or []):
+            return True
+        if self.P_RANGE is not None and isinstance(self.P_RANGE[0], collections.abc.Sequence):
+            return not any(p[0] <= t_min and t_max <= p[1] for p in self.P_RANGE)
+        return False
+
+    def _intervalles_continus(self, t_min, t_max):
+        """
+        Découpe [t_min, t_max] en intervalles où la courbe est continue,
+        en utilisant :attr:`DISCONTINUITES` et :attr:`DT` comme le fait manim.
+        """
+        if self.DISCONTINUITES is None:
+            return [(t_min, t_max)]
+        bornes = sorted(
+            [t_min, t_max] +
+            [d - self.DT for d in self.DISCONTINUITES if t_min <= d <= t_max] +
+            [d + self.DT for d in self.DISCONTINUITES if t_min <= d <= t_max]
+        )
+        return list(zip(bornes[0::2], bornes[1::2]))
+
+    def _cadre_visible(self):
+        """
+        Demi-largeur et demi-hauteur de la zone, centrée en l'origine de la
+        scène, qui contient tout ce qui est visible à un moment du tracé :
+        le cadre actuel, et ce qui y entre pendant le déplacement puis
+        l'agrandissement final du repère (:attr:`DECALAGE_FINAL`,
+        :attr:`ECHELLE_FINALE`).
+        """
+        demi = np.array([config.frame_width / 2, config.frame_height / 2])
+        decalage = np.asarray(self.DECALAGE_FINAL, dtype=float)[:2]
+        origine = np.asarray(self.repere.coords_to_point(0, 0, 0), dtype=float)[:2] + decalage
+        coins = np.array([[-1, -1], [1, 1]])*demi
+        antecedents = np.concatenate([
+            coins,
+            coins - decalage, # après le déplacement
+            (coins - origine)/self.ECHELLE_FINALE + origine - decalage # à la fin
+        ])
+        return tuple(np.abs(antecedents).max(axis=0))
+
+    def _echantillonne(self, p_range, transforme=lambda t: t):
+        """
+        Échantillonne le morceau de courbe M(transforme(t)) pour t dans p_range.
+
+        La tolérance est donnée par :attr:`TOLERANCE_PIXELS`, convertie dans
+        les unités de la scène, et tient compte de l'agrandissement final de
+        :meth:`trace_complet`. Seules les parties hors de la zone donnée par
+        :meth:`_cadre_visible` ne sont pas raffinées. Retourne une liste de
+        couples (ts, points), un par chemin continu.
+        """
+        tolerance = (self.TOLERANCE_PIXELS * config.frame_width / config.pixel_width
+                     / self.ECHELLE_FINALE)
+        cadre = self._cadre_visible()
+        chemins = []
+        for t_min, t_max in self._intervalles_continus(*p_range):
+            ts, points = echantillonne(
+                lambda ts: self._vers_repere(self._evalue_courbe(ts, transforme)),
+                t_min,
+                t_max,
+                tolerance,
+                budget=self.BUDGET_POINTS,
+                cadre=cadre
+            )
+            # les points non définis coupent le chemin
+            finis = np.isfinite(points).all(axis=1)
+            coupures = np.flatnonzero(np.diff(finis.astype(int)) != 0) + 1
+            for morceau in np.split(np.arange(len(ts)), coupures):
+                if len(morceau) > 1 and finis[morceau[0]]:
+                    chemins.append((ts[morceau], points[morceau]))
+        return chemins
+
+    def _joue_morceau(self, points_chemins, couleur):
+        """
+        Construit le morceau de courbe à partir d'une liste de np.array de
+        points (un par chemin continu), puis l'anime.
+        """
+        courbe = VMobject(color=couleur)
+        for points in points_chemins:
+            courbe.start_new_path(points[0])
+            courbe.add_points_as_corners(points[1:])
+        creation = CreationCurviligne if self.TRACE_CURVILIGNE else Create
+        self.play(creation(courbe, run_time=2))
+        self.groupe_repere.add(courbe)
+        self.wait(self.INTERVALLE_LEGENDE)
+
     def _trace_morceau(self, p_range, transforme=lambda t: t, couleur="#FFFFFF"):
         if len(p_range) == 3: # couleur fournie dans l'intervalle
             # celle-ci prend le pas sur l'argument optionnel.
             couleur = p_range[2]
             p_range = p_range[:2]
-        courbe = ParametricFunction(
-            lambda t: self.repere.coords_to_point(*self.courbe(transforme(t))),
-            t_range=p_range,
-            use_vectorized=False,
-            discontinuities=self.DISCONTINUITES,
-            dt = self.DT,
-            color=couleur
-        )
-        self.play(Create(courbe, run_time=2))
-        self.groupe_repere.add(courbe)
-        self.wait(self.INTERVALLE_LEGENDE)
+        chemins = self._echantillonne(p_range, transforme)
+        for ts, points in chemins:
+            # on conserve les points calculés pour les éventuels symétriques
+            self._echantillons.append((
+                np.vectorize(transforme, otypes=[float])(ts),
+                self._depuis_repere(points)
+            ))
+        self._joue_morceau([points for _, points in chemins], couleur)
+
+    def _echantillons_caches(self, p_range):
+        """
+        Rassemble les points déjà calculés dont le paramètre est dans p_range.
+        Chaque chemin déjà tracé reste un chemin à part (jamais relié à un
+        autre), restreint à p_range et parcouru par paramètre croissant.
+
+        Retourne une liste de couples (ts, coordonnées), un par chemin
+        continu, ou None si les chemins déjà tracés ne couvrent pas p_range
+        sans trou (entre deux morceaux tracés séparément, de part et d'autre
+        d'un point non défini...).
+        """
+        t_min, t_max = p_range[:2]
+        eps = 1e-9 * max(1, abs(t_min), abs(t_max))
+        chemins = []
+        for ts, coords in self._echantillons:
+            if len(ts) > 1 and ts[0] > ts[-1]:
+                ts, coords = ts[::-1], coords[:, ::-1]
+            dedans = (ts >= t_min - eps) & (ts <= t_max + eps)
+            ts, coords = ts[dedans], coords[:, dedans]
+            # coupure aux discontinuités
+            coupures = set()
+            for d in self.DISCONTINUITES or []:
+                coupures.update(np.flatnonzero((ts[:-1] < d) & (ts[1:] > d)) + 1)
+            for morceau in np.split(np.arange(len(ts)), sorted(coupures)):
+                if len(morceau) > 1:
+                    chemins.append((ts[morceau], coords[:, morceau]))
+        chemins.sort(key=lambda chemin: chemin[0][0])
+        resultat = []
+        atteint = t_min
+        for ts, coords in chemins:
+            if ts[-1] <= atteint + eps:
+                continue # déjà couvert
+            if ts[0] > atteint + eps:
+                return None # trou
+            resultat.append((ts, coords))
+            atteint = ts[-1]
+        if atteint < t_max - eps:
+            return None
+        return resultat
+
+    def _trace_symetrique(self, sym: Symetrie):
+        """
+        Trace le morceau de courbe symétrique, M(sym.transforme(t)) pour t
+        dans sym.p_range.
+
+        Si sym_M est affine, ce morceau est l'image des points déjà calculés
+        et aucune évaluation de la courbe n'est nécessaire. Sinon, ou si les
+        morceaux déjà tracés ne couvrent pas l'intervalle, on revient à
+        :meth:`_trace_morceau`.
+        """
+        affine = sym.matrice_affine()
+        chemins = self._echantillons_caches(sym.p_range) if affine else None
+        if chemins is None:
+            self._trace_morceau(
+                sym.p_range,
+                transforme=sym.transforme,
+                couleur=sym.couleur
+            )
+            return
+        matrice, vecteur = affine
+        images = []
+        for ts, coords in chemins:
+            image = matrice @ coords + vecteur[:, None]
+            images.append(self._vers_repere(image))
+            self._echantillons.append((
+                np.vectorize(sym.transforme, otypes=[float])(ts),
+                image
+            ))
+        self._joue_morceau(images, sym.couleur)
+
+    def _orbite_tangentes(self, tangentes, tracees=True):
+        """
+        Images des tangentes par les symétries, appliquées dans l'ordre du
+        tracé (la dernière de :attr:`SYMETRIES` d'abord) : chaque symétrie
+        s'applique aux tangentes données et à toutes les images déjà
+        obtenues.
+
+        Une image qui coïncide avec une flèche déjà tracée (même point, même
+        direction et même sens, à :attr:`TOLERANCE_TANGENTES` près) est
+        écartée : point sur un axe de symétrie dont la tangente est
+        invariante... Une image de sens opposé est une autre flèche et
+        reste tracée. Si `tracees` est faux, les tangentes données n'ont
+        pas été tracées (mode `SKIP`) et leurs images ne sont comparées
+        qu'entre elles. Retourne, pour chaque symétrie, la liste des
+        nouvelles tangentes.
+        """
+        tol = self.TOLERANCE_TANGENTES
+        presentes = list(tangentes)
+        deja = presentes if tracees else []
+        points = [np.asarray(self.courbe(t.param), dtype=float) for t in deja]
+        vecteurs = [np.asarray(t.vect, dtype=float) for t in deja]
+        orbite = []
+        for sym in reversed(self.SYMETRIES):
+            nouvelles = []
+            for tgte in list(presentes):
+                image = tgte.symetrique(sym)
+                point = np.asarray(self.courbe(image.param), dtype=float)
+                vecteur = np.asarray(image.vect, dtype=float)
+                if points:
+                    ecarts = np.linalg.norm(np.array(points) - point, axis=1)
+                    # même direction : produit vectoriel nul, et même sens
+                    colineaires = np.linalg.norm(
+                        np.cross(np.array(vecteurs), vecteur), axis=1
+                    ) <= tol*np.linalg.norm(vecteur)*np.linalg.norm(vecteurs, axis=1)
+                    meme_sens = np.array(vecteurs) @ vecteur > 0
+                    if np.any((ecarts <= tol) & colineaires & meme_sens):
+                        continue
+                presentes.append(image)
+                points.append(point)
+                vecteurs.append(vecteur)
+                nouvelles.append(image)
+            orbite.append(nouvelles)
+        return orbite
 
     def trace_complet(self):
+        self._echantillons = []
         txt_courrant = Tex(
             "On obtient finalement le tracé"
         ).move_to(self.TEXT_DROITE).scale(0.7)
@@ -951,9 +2466,12 @@ class PasAPas(Scene):
             else:
                 self._trace_morceau(self.P_RANGE)
         else:
-            tangentes_supp = [(None, ps.tgte) for ps in self.POINTS_SINGULIERS]
-            # tangentes placées par symétrie, dont il faut caluler
-            # des autres symétriques éventuels.
+            # tangentes ajoutées par chaque symétrie, calculées d'avance
+            orbite = self._orbite_tangentes(
+                [tgte for _, tgte in self.POINTS_REGULIERS] +
+                [ps.tgte for ps in self.POINTS_SINGULIERS],
+                tracees=not self.SKIP
+            )
             for i, sym in enumerate(reversed(self.SYMETRIES)):
                 if i == 0:
                     txt_courrant = Tex(
@@ -967,24 +2485,22 @@ class PasAPas(Scene):
                     color=sym.couleur
                 ).scale(0.7).next_to(txt_courrant, DOWN)
                 self.affiche_texte(txt_courrant, remplace=False)
-                # tangentes symétriques
-                tgtes = []
-                for _ , tgte in self.POINTS_REGULIERS + tangentes_supp:
-                    # trace la tangente en M(t0), dirigée par v
-                    tgte_sym = tgte.symetrique(sym)
-                    tgte_sym.trace(self, couleur=sym.couleur)
-                    tgtes.append([None, tgte_sym])
-                tangentes_supp.extend(tgtes)
-                
-                self._trace_morceau(
-                    sym.p_range,
-                    transforme=sym.transforme,
-                    couleur=sym.couleur
-                )
+                # tangentes symétriques, toutes en une fois
+                if orbite[i]:
+                    points = VGroup(*[t.marque(self, sym.couleur) for t in orbite[i]])
+                    fleches = VGroup(*[t.fleche(self, sym.couleur) for t in orbite[i]])
+                    self.groupe_repere.add(points, fleches)
+                    self.add(points)
+                    self.play(FadeIn(fleches))
+
+                self._trace_symetrique(sym)
         self.wait(2*self.INTERVALLE_LEGENDE)
         self.efface_textes()
-        self.play(*[e.animate.shift(RIGHT*3) for e in self.groupe_repere])
-        self.play(*[e.animate.scale(1.2, about_point=self.repere.c2p(0,0,0)) for e in self.groupe_repere])
+        # une seule animation pour tout le repère, quel que soit son contenu
+        self.play(TransformationGroupe.translation(self.groupe_repere, self.DECALAGE_FINAL))
+        self.play(TransformationGroupe.homothetie(
+            self.groupe_repere, self.ECHELLE_FINALE, self.repere.c2p(0, 0, 0)
+        ))
         self.wait(2*self.INTERVALLE_LEGENDE)
     
     def construct(self):
@@ -1,6 +1,6 @@
 from manim import *
 
-from construction_courbe import PasAPas, Symetrie, Tangente
+from construction_courbe import Differe, PasAPas, Symetrie, Tangente
 
 class Lissajous(PasAPas):
 
@@ -13,10 +13,10 @@ class Lissajous(PasAPas):
         {"x": UP/3, "y": RIGHT/3, "M": DOWN/2}
     ] #positions des légendes pour les points
     TEXTES_POINTS = [
-        Text("Plaçons M(0)").move_to(3.2*UP+3*RIGHT),
-        # placement dans la scene
-        Text("puis M(1)").move_to(3.2*UP+2*RIGHT),
-        Text("et M(2)").move_to(3.2*UP+2*RIGHT)
+        Differe(Text, "Plaçons M(0)").move_to(3.2*UP+3*RIGHT),
+        # placement dans la scene, construit seulement à l'affichage
+        Differe(Text, "puis M(1)").move_to(3.2*UP+2*RIGHT),
+        Differe(Text, "et M(2)").move_to(3.2*UP+2*RIGHT)
     ] # textes affichés en haut
     # présentation des symétries
     SYMETRIES = [
@@ -30,11 +30,13 @@ class Lissajous(PasAPas):
             #deux paramètres pour animer M(t) et M(-t)
             (0.2, 1),
             # presentation, mise à l'échelle et placement
-            Tex(
+            Differe(
+                Tex,
                 "On a $M(-t) = \\begin{pmatrix}x(t) \\\\ -y(t) \\end{pmatrix}$"
             ).scale(0.7).move_to(PasAPas.TEXT_DROITE),
             # conclusion
-            Tex(
+            Differe(
+                Tex,
                 "M(-t) est le symétrique de M(t) par rapport à (Ox)"
             ).scale(0.7).move_to(PasAPas.TEXT_DROITE),
             # les intervalles
@@ -47,10 +49,12 @@ class Lissajous(PasAPas):
             lambda M: np.array([-M[0], -M[1], 0]),
             "$\\pi-t$",
             (0.3, 1.2),
-            Tex(
+            Differe(
+                Tex,
                 "On a $M(\\pi-t) = \\begin{pmatrix}-x(t) \\\\ -y(t) \\end{pmatrix}$"
             ).scale(0.7).move_to(PasAPas.TEXT_DROITE),
-            Tex(
+            Differe(
+                Tex,
                 "$M(\\pi-t)$ est le symétrique de M(t) par rapport à O"
             ).scale(0.7).move_to(PasAPas.TEXT_DROITE),
             ["$[0, \\pi]$", "$[0, \\frac{\\pi}{2}]$", "$[\\frac{\\pi}{2}, \\pi]$"],
@@ -0,0 +1,210 @@
+"""
+Profilage optionnel du rendu d'une scène :class:`construction_courbe.PasAPas`.
+
+Le temps de chaque section (délimitée par next_section) est réparti en phases :
+    - `construction` : code python de la scène hors animations (création des
+      objets, calculs, ...)
+    - `tex` : compilation LaTeX (ou lecture du cache)
+    - `animation` : interpolation des animations et mises à jour
+    - `rendu` : rastérisation des images
+    - `ecriture` : envoi des images à l'encodeur
+
+On relève aussi le nombre d'images écrites, d'animations jouées et d'objets
+présents dans la scène, ainsi que le nombre d'appels et le temps (inclusif)
+des méthodes instrumentées.
+
+Rien n'est installé tant que le profilage n'est pas demandé : le coût est
+alors nul.
+"""
+
+import json
+from pathlib import Path
+import time
+
+import manim.mobject.text.tex_mobject as tex_mobject
+
+PHASES = ("construction", "tex", "animation", "rendu", "ecriture")
+
+# méthodes de PasAPas dont on compte les appels
+METHODES = ("affiche_texte", "efface_textes", "annonce_episode")
+
+
+def tableau_texte(lignes: list, gauche=(0,)) -> str:
+    """
+    Met en forme un tableau texte : colonnes séparées par des barres,
+    alignées à droite sauf celles d'indice dans `gauche`.
+
+    :param lignes: liste de lignes (entête comprise), chacune une liste de
+        chaînes.
+    """
+    largeurs = [max(len(ligne[i]) for ligne in lignes) for i in range(len(lignes[0]))]
+    return "\n".join(
+        " | ".join(
+            case.ljust(largeur) if i in gauche else case.rjust(largeur)
+            for i, (case, largeur) in enumerate(zip(ligne, largeurs))
+        )
+        for ligne in lignes
+    )
+
+
+class Profileur():
+    """
+    Relève les temps d'une scène, section par section.
+
+    :param scene: la scène à profiler, instance de PasAPas.
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.sections = []
+        self._section = None
+        self._pile = [] # phases en cours : [phase, début, temps des phases filles]
+        self._tex_original = None
+        self._tex_mesure = None
+        self.video = None # chemin de la vidéo produite, donné par la scène
+        self.images_par_seconde = None
+        self.section("Préparation")
+
+    def section(self, nom: str):
+        """
+        Termine la section courante et en commence une nouvelle.
+        """
+        maintenant = time.perf_counter()
+        self._ferme_section(maintenant)
+        self._section = {
+            "nom": nom,
+            "debut": maintenant,
+            "duree": 0.0,
+            "phases": {phase: 0.0 for phase in PHASES},
+            "images": 0,
+            "animations": 0,
+            "mobjects": 0,
+            "appels": {}
+        }
+        self.sections.append(self._section)
+
+    def _ferme_section(self, maintenant):
+        section = self._section
+        if section is None:
+            return
+        section["duree"] = maintenant - section["debut"]
+        mesure = sum(section["phases"][phase] for phase in PHASES[1:])
+        section["phases"]["construction"] = max(section["duree"] - mesure, 0.0)
+        section["mobjects"] = len(getattr(self.scene, "mobjects", []))
+
+    def enveloppe(self, nom: str, fonction, phase=None):
+        """
+        Retourne une version de `fonction` qui compte ses appels dans la
+        section courante et, si `phase` est donnée, y ajoute son temps
+        propre (hors phases imbriquées).
+        """
+        def mesuree(*args, **kwargs):
+            debut = time.perf_counter()
+            if phase is not None:
+                self._pile.append([phase, debut, 0.0])
+            try:
+                return fonction(*args, **kwargs)
+            finally:
+                duree = time.perf_counter() - debut
+                if phase is not None:
+                    _, _, filles = self._pile.pop()
+                    self._section["phases"][phase] += duree - filles
+                    if self._pile:
+                        self._pile[-1][2] += duree
+                appels = self._section["appels"].setdefault(nom, [0, 0.0])
+                appels[0] += 1
+                appels[1] += duree
+        return mesuree
+
+    def installe(self):
+        """
+        Instrumente la scène, son renderer et la compilation LaTeX.
+        """
+        scene = self.scene
+        for nom in METHODES:
+            setattr(scene, nom, self.enveloppe(nom, getattr(scene, nom)))
+        play = self.enveloppe("play", scene.play, phase="animation")
+        def play_compte(*args, **kwargs):
+            self._section["animations"] += 1
+            return play(*args, **kwargs)
+        scene.play = play_compte
+        scene.wait = self.enveloppe("wait", scene.wait, phase="animation")
+        renderer = getattr(scene, "renderer", None)
+        if renderer is not None and hasattr(renderer, "render"):
+            renderer.render = self.enveloppe("render", renderer.render, phase="rendu")
+        file_writer = getattr(renderer, "file_writer", None)
+        if file_writer is not None and hasattr(file_writer, "write_frame"):
+            write_frame = self.enveloppe("write_frame", file_writer.write_frame, phase="ecriture")
+            def write_frame_compte(*args, **kwargs):
+                # write_frame(frame, num_frames=1) ou, selon la version de
+                # manim, write_frame(frame, *, repeat=1)
+                images = kwargs.get("num_frames", kwargs.get("repeat"))
+                if images is None:
+                    images = args[1] if len(args) > 1 else 1
+                self._section["images"] += images
+                return write_frame(*args, **kwargs)
+            file_writer.write_frame = write_frame_compte
+        if renderer is not None and hasattr(renderer, "scene_finished"):
+            # assemblage final de la vidéo
+            renderer.scene_finished = self.enveloppe(
+                "scene_finished", renderer.scene_finished, phase="ecriture"
+            )
+        self._tex_original = tex_mobject.tex_to_svg_file
+        self._tex_mesure = self.enveloppe("tex_to_svg_file", self._tex_original, phase="tex")
+        tex_mobject.tex_to_svg_file = self._tex_mesure
+
+    def termine(self) -> dict:
+        """
+        Ferme la dernière section, retire l'instrumentation LaTeX et
+        retourne le rapport.
+        """
+        self._ferme_section(time.perf_counter())
+        self._section = None
+        if self._tex_original is not None:
+            # sauf si un autre a déjà rétabli la fonction (voir
+            # tex_commands.desactive_caches)
+            if tex_mobject.tex_to_svg_file is self._tex_mesure:
+                tex_mobject.tex_to_svg_file = self._tex_original
+            self._tex_original = None
+        return self.rapport()
+
+    def rapport(self) -> dict:
+        sections = [
+            {cle: valeur for cle, valeur in section.items() if cle != "debut"}
+            for section in self.sections
+        ]
+        return {
+            "scene": type(self.scene).__name__,
+            "duree": sum(section["duree"] for section in sections),
+            "images": sum(section["images"] for section in sections),
+            "video": self.video,
+            "images_par_seconde": self.images_par_seconde,
+            "sections": sections
+        }
+
+    def ecrit(self, chemin) -> Path:
+        """
+        Écrit le rapport au format JSON.
+        """
+        chemin = Path(chemin)
+        chemin.parent.mkdir(parents=True, exist_ok=True)
+        with open(chemin, "w", encoding="utf-8") as f:
+            json.dump(self.rapport(), f, indent=2, ensure_ascii=False)
+        return chemin
+
+    def tableau(self) -> str:
+        """
+        Résumé du rapport sous forme de tableau texte, une ligne par section.
+        """
+        entete = ["section", "total", *PHASES, "images", "anims", "mobjects"]
+        lignes = [entete]
+        for section in self.rapport()["sections"]:
+            lignes.append([
+                section["nom"],
+                f"{section['duree']:.2f}",
+                *[f"{section['phases'][phase]:.2f}" for phase in PHASES],
+                str(section["images"]),
+                str(section["animations"]),
+                str(section["mobjects"])
+            ])
+        return tableau_texte(lignes)
@@ -0,0 +1,234 @@
+"""
+Rendu par lots de toutes les scènes :class:`construction_courbe.PasAPas` du
+dossier, sans relancer la commande manim pour chacune.
+
+Les sous-classes de PasAPas sont cherchées dans tous les modules du dossier,
+puis rendues par un groupe de processus. Les processus partagent les caches
+disque de :mod:`tex_commands` (textes LaTeX, formats et géométrie), et sont
+remplacés après un nombre donné de scènes pour borner la mémoire. Chaque
+rendu compile ses éventuels textes absents du cache dans son propre dossier
+Tex : manim en supprime les fichiers intermédiaires après chaque
+compilation.
+
+Un manifeste (`manifeste.json` dans le dossier media) associe à chaque scène
+l'empreinte de ses sources (son module, les modules du dossier dont il
+dépend et les fichiers .tex qu'il lit) et la vidéo produite. Une scène dont
+l'empreinte n'a pas changé et dont la vidéo existe n'est pas rendue à nouveau.
+
+Utilisation ::
+
+    python rendu_lot.py                         # toutes les scènes
+    python rendu_lot.py Astroide Lissajous      # seulement celles-ci
+    python rendu_lot.py --processus 4 --recyclage 2 --qualite high_quality
+    python rendu_lot.py --force                 # ignore le manifeste
+"""
+
+import argparse
+import ast
+import concurrent.futures
+import hashlib
+import importlib
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+import types
+
+DOSSIER = Path(__file__).resolve().parent
+
+RECYCLAGE = 2 # nombre de scènes rendues par un processus avant remplacement
+QUALITE = "low_quality"
+
+
+def decouvre() -> dict:
+    """
+    Retourne les sous-classes de PasAPas définies dans les modules du
+    dossier, sous la forme {nom de classe: nom de module}.
+
+    Les modules sont analysés sans être importés (certains, comme
+    logging_conf ou les outils de mesure, ont des effets à l'import) : une
+    classe est une scène si l'une de ses bases porte le nom de PasAPas ou
+    d'une autre scène, quel que soit le module qui la fournit.
+    """
+    classes = [] # (nom, noms des bases, module)
+    for fichier in sorted(DOSSIER.glob("*.py")):
+        arbre = ast.parse(fichier.read_text(encoding="utf-8"), filename=str(fichier))
+        for noeud in arbre.body:
+            if isinstance(noeud, ast.ClassDef):
+                bases = {
+                    base.attr if isinstance(base, ast.Attribute) else getattr(base, "id", None)
+                    for base in noeud.bases
+                }
+                classes.append((noeud.name, bases, fichier.stem))
+    scenes = {}
+    connues = {"PasAPas"}
+    while True:
+        nouvelles = {
+            nom: module for nom, bases, module in classes
+            if bases & connues and nom not in scenes
+        }
+        if not nouvelles:
+            return scenes
+        scenes.update(nouvelles)
+        connues.update(nouvelles)
+
+
+def dependances(module: types.ModuleType, vus=None) -> set:
+    """
+    Fichiers des modules du dossier dont dépend `module`, lui compris : ceux
+    qu'il importe, ou dont il importe des objets, récursivement.
+    """
+    vus = set() if vus is None else vus
+    fichier = Path(getattr(module, "__file__", "") or "").resolve()
+    if fichier.parent != DOSSIER or fichier in vus:
+        return vus
+    vus.add(fichier)
+    for valeur in vars(module).values():
+        if isinstance(valeur, types.ModuleType):
+            dependances(valeur, vus)
+        else:
+            source = sys.modules.get(getattr(valeur, "__module__", None) or "")
+            if source is not None:
+                dependances(source, vus)
+    return vus
+
+
+def empreinte(module_nom: str, qualite: str) -> str:
+    """
+    Empreinte des sources dont dépend le module, des fichiers .tex du
+    dossier qu'elles nomment (tableaux de variations), et de la qualité
+    demandée.
+    """
+    fichiers = dependances(importlib.import_module(module_nom))
+    sources = "".join(fichier.read_text(encoding="utf-8") for fichier in fichiers)
+    fichiers |= {f for f in DOSSIER.glob("*.tex") if f.name in sources}
+    h = hashlib.sha256(qualite.encode())
+    for fichier in sorted(fichiers):
+        h.update(fichier.name.encode())
+        h.update(fichier.read_bytes())
+    return h.hexdigest()
+
+
+def rend(classe: str, module_nom: str, media: str, qualite: str, processus_tex: int) -> str:
+    """
+    Rendu d'une scène dans le processus courant. Retourne le chemin de la
+    vidéo produite.
+    """
+    from manim import tempconfig
+
+    module = importlib.import_module(module_nom)
+    with tempfile.TemporaryDirectory(prefix="courbes-tex-") as tex_dir:
+        options = {
+            "quality": qualite,
+            "media_dir": media,
+            "tex_dir": tex_dir, # media/Tex est partagé par les processus
+            "input_file": module.__file__,
+            "preview": False,
+            "progress_bar": "none"
+        }
+        with tempconfig(options):
+            scene = getattr(module, classe)()
+            # la précompilation LaTeX se partage les cœurs avec les autres processus
+            scene.PROCESSUS_TEX = processus_tex
+            scene.render()
+            return str(scene.renderer.file_writer.movie_file_path)
+
+
+class Manifeste():
+    """
+    Manifeste des vidéos produites : nom de scène -> {source, sortie}.
+    """
+
+    def __init__(self, chemin):
+        self.chemin = Path(chemin)
+        self.entrees = {}
+        if self.chemin.exists():
+            self.entrees = json.loads(self.chemin.read_text(encoding="utf-8"))
+
+    def a_jour(self, classe: str, source: str) -> bool:
+        entree = self.entrees.get(classe)
+        return (entree is not None and entree["source"] == source
+                and Path(entree["sortie"]).exists())
+
+    def enregistre(self, classe: str, source: str, sortie: str):
+        self.entrees[classe] = {"source": source, "sortie": sortie}
+        # réécrit à chaque scène : un lot interrompu garde ce qui est fait
+        self.chemin.parent.mkdir(parents=True, exist_ok=True)
+        temporaire = self.chemin.with_suffix(".tmp")
+        temporaire.write_text(json.dumps(self.entrees, indent=2), encoding="utf-8")
+        os.replace(temporaire, self.chemin)
+
+
+def lot(classes=None, processus=None, recyclage=RECYCLAGE,
+        qualite=QUALITE, media=None, force=False) -> dict:
+    """
+    Rend les scènes demandées (toutes par défaut) qui ne sont pas à jour.
+
+    Retourne {classe: chemin de la vidéo ou message d'erreur}.
+    """
+    scenes = decouvre()
+    if classes:
+        inconnues = set(classes) - set(scenes)
+        if inconnues:
+            raise ValueError(f"Scènes inconnues : {', '.join(sorted(inconnues))}")
+        scenes = {classe: scenes[classe] for classe in classes}
+    media = Path(media or DOSSIER / "media").resolve()
+    manifeste = Manifeste(media / "manifeste.json")
+    sources = {classe: empreinte(module, qualite) for classe, module in scenes.items()}
+    a_rendre = [
+        classe for classe in scenes
+        if force or not manifeste.a_jour(classe, sources[classe])
+    ]
+    resultats = {
+        classe: manifeste.entrees[classe]["sortie"]
+        for classe in scenes if classe not in a_rendre
+    }
+    for classe in resultats:
+        print(f"{classe} à jour")
+    if not a_rendre:
+        return resultats
+
+    processus = min(processus or os.cpu_count() or 1, len(a_rendre))
+    processus_tex = max((os.cpu_count() or 1) // processus, 1)
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=processus, max_tasks_per_child=recyclage) as executeur:
+        taches = {
+            executeur.submit(
+                rend, classe, scenes[classe], str(media), qualite, processus_tex
+            ): classe
+            for classe in a_rendre
+        }
+        for tache in concurrent.futures.as_completed(taches):
+            classe = taches[tache]
+            try:
+                sortie = tache.result()
+            except Exception as e:
+                resultats[classe] = f"Erreur : {e!r}"
+                print(f"{classe} : échec ({e!r})")
+                continue
+            manifeste.enregistre(classe, sources[classe], sortie)
+            resultats[classe] = sortie
+            print(f"{classe} -> {sortie}")
+    return resultats
+
+
+def main(arguments=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("scenes", nargs="*", help="classes à rendre, toutes par défaut")
+    parser.add_argument("--processus", type=int, default=None,
+        help="nombre de processus de rendu, os.cpu_count() par défaut")
+    parser.add_argument("--recyclage", type=int, default=RECYCLAGE,
+        help="nombre de scènes rendues par un processus avant son remplacement")
+    parser.add_argument("--qualite", default=QUALITE)
+    parser.add_argument("--media", type=Path, default=None)
+    parser.add_argument("--force", action="store_true",
+        help="rend toutes les scènes, même à jour")
+    args = parser.parse_args(arguments)
+    resultats = lot(args.scenes, args.processus, args.recyclage,
+        args.qualite, args.media, args.force)
+    return 1 if any(r.startswith("Erreur") for r in resultats.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+"""
+Rendu d'une scène :class:`construction_courbe.PasAPas` section par section,
+les sections étant rendues en parallèle par des processus distincts.
+
+Un premier passage à blanc (:meth:`PasAPas.passage_a_blanc`) donne la liste
+des sections et les textes LaTeX, compilés aussitôt dans le cache disque.
+Chaque processus rend ensuite une seule section (voir
+:attr:`PasAPas.SECTION_RENDUE`) : les sections précédentes sont jouées sans
+produire d'image, ce qui reconstitue l'état de la scène (contenu de
+`groupe_repere`, repère affiché, numéro d'épisode, textes courants), et le
+rendu s'arrête à la fin de la section.
+
+Les vidéos des sections sont enfin mises bout à bout par ffmpeg, sans
+réencodage. La durée totale est proche de celle de la plus longue section.
+
+Le rendu est incrémental : chaque section a une empreinte (code exécuté,
+attributs de classe utilisés et état de la scène à son début, voir
+:meth:`PasAPas._empreintes_sections`) et sa vidéo est conservée dans
+`<media>/sections/<scène>`. Seules les sections dont l'empreinte a changé,
+directement ou parce qu'une section précédente a modifié l'état de la
+scène, sont rendues à nouveau.
+
+Utilisation ::
+
+    python rendu_sections.py Astroide
+    python rendu_sections.py Lissajous --processus 4 --qualite high_quality
+    python rendu_sections.py Tractrice --force      # ignore les sections déjà rendues
+"""
+
+import argparse
+import concurrent.futures
+import importlib
+import os
+from pathlib import Path
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import rendu_lot
+
+QUALITE = rendu_lot.QUALITE
+
+
+def sections(scene_classe, processus_tex=None):
+    """
+    Passage à blanc de la scène : compile ses textes LaTeX dans le cache
+    disque et retourne les noms de ses sections, section 0 comprise, et
+    leurs empreintes. Retourne (None, None) si la construction à blanc a
+    échoué.
+    """
+    import tex_commands as tc
+
+    entrees, noms, empreintes = scene_classe.passage_a_blanc(empreintes=True)
+    for erreur in tc.precompile(entrees, processus=processus_tex):
+        print(f"Erreur de précompilation {erreur}")
+    if noms is None:
+        return None, None
+    return ["Début"] + noms, empreintes
+
+
+class CacheSections():
+    """
+    Vidéos des sections déjà rendues d'une scène, nommées par l'empreinte
+    de la section et la qualité. Une section sans animation est notée par
+    un fichier vide.
+
+    :param dossier: dossier propre à la scène.
+    """
+
+    def __init__(self, dossier, qualite: str):
+        self.dossier = Path(dossier)
+        self.qualite = qualite
+
+    def chemin(self, empreinte: str) -> Path:
+        return self.dossier / f"{empreinte[:32]}-{self.qualite}.mp4"
+
+    def cherche(self, empreinte: str):
+        """
+        Retourne (trouvée, chemin de la vidéo ou None si la section est vide).
+        """
+        chemin = self.chemin(empreinte)
+        if not chemin.exists():
+            return False, None
+        return True, (chemin if chemin.stat().st_size > 0 else None)
+
+    def ajoute(self, empreinte: str, video) -> Path:
+        self.dossier.mkdir(parents=True, exist_ok=True)
+        chemin = self.chemin(empreinte)
+        temporaire = chemin.with_suffix(".tmp")
+        if video is None:
+            temporaire.write_bytes(b"")
+        else:
+            shutil.copyfile(video, temporaire)
+        os.replace(temporaire, chemin)
+        return chemin
+
+    def nettoie(self, empreintes):
+        """
+        Supprime les vidéos de cette qualité qui ne correspondent à aucune
+        des empreintes données : seul le dernier rendu est conservé.
+        """
+        gardes = {self.chemin(empreinte) for empreinte in empreintes}
+        for chemin in self.dossier.glob(f"*-{self.qualite}.mp4"):
+            if chemin not in gardes:
+                chemin.unlink(missing_ok=True)
+
+
+def rend_section(classe: str, module_nom: str, indice: int, media: str, qualite: str):
+    """
+    Rendu de la section `indice` dans le processus courant. Retourne le
+    chemin de la vidéo, ou None si la section ne contient aucune animation.
+
+    `media` doit être propre à la section : manim y nettoie le dossier des
+    vidéos partielles de la scène, et les fichiers intermédiaires de LaTeX
+    dans `media/Tex`.
+    """
+    from manim import tempconfig
+
+    module = importlib.import_module(module_nom)
+    options = {
+        "quality": qualite,
+        "media_dir": media,
+        "input_file": module.__file__,
+        "output_file": f"{classe}-{indice:02d}",
+        "preview": False,
+        "progress_bar": "none"
+    }
+    with tempconfig(options):
+        scene = getattr(module, classe)()
+        scene.SECTION_RENDUE = indice
+        scene.PRECOMPILE_TEX = False # déjà fait par le processus principal
+        scene.render()
+        chemin = Path(scene.renderer.file_writer.movie_file_path)
+    return str(chemin) if chemin.exists() else None
+
+
+def concatene(videos, sortie):
+    """
+    Met bout à bout les vidéos, sans réencodage (demuxer concat de ffmpeg).
+    Elles doivent avoir les mêmes paramètres, ce qui est le cas des
+    sections d'une même scène.
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise RuntimeError("ffmpeg est nécessaire pour assembler les sections")
+    sortie = Path(sortie)
+    sortie.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory() as dossier:
+        liste = Path(dossier) / "sections.txt"
+        liste.write_text(
+            "".join(f"file '{Path(video).resolve().as_posix()}'\n" for video in videos),
+            encoding="utf-8"
+        )
+        subprocess.run(
+            [ffmpeg, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+             "-i", str(liste), "-c", "copy", str(sortie)],
+            check=True
+        )
+    return sortie
+
+
+def rend(classe: str, processus=None, qualite=QUALITE, media=None, force=False) -> Path:
+    """
+    Rend la scène `classe` (une sous-classe de PasAPas du dossier) en
+    parallélisant ses sections. Retourne le chemin de la vidéo.
+
+    Les sections dont l'empreinte n'a pas changé depuis le dernier rendu
+    reprennent leur vidéo précédente, sauf si `force` est vrai. Si le
+    passage à blanc échoue, la scène est rendue d'un seul tenant.
+    """
+    module_nom = rendu_lot.decouvre()[classe]
+    module = importlib.import_module(module_nom)
+    media = Path(media or rendu_lot.DOSSIER / "media").resolve()
+    noms, empreintes = sections(getattr(module, classe), processus)
+    if noms is None:
+        print(f"Passage à blanc de {classe} impossible, rendu séquentiel")
+        return Path(rendu_lot.rend(classe, module_nom, str(media), qualite, processus))
+
+    cache = CacheSections(media / "sections" / classe, qualite)
+    videos = {}
+    for indice, empreinte in enumerate(empreintes):
+        trouvee, video = cache.cherche(empreinte)
+        if trouvee and not force:
+            videos[indice] = video
+            print(f"{classe} : section {noms[indice]} inchangée")
+    a_rendre = [indice for indice in range(len(noms)) if indice not in videos]
+
+    with tempfile.TemporaryDirectory(prefix="courbes-sections-") as dossier:
+        if a_rendre:
+            processus = min(processus or os.cpu_count() or 1, len(a_rendre))
+            with concurrent.futures.ProcessPoolExecutor(max_workers=processus) as executeur:
+                # un dossier media par section, voir rend_section
+                taches = {
+                    indice: executeur.submit(
+                        rend_section, classe, module_nom, indice,
+                        str(Path(dossier) / f"section-{indice:02d}"), qualite
+                    )
+                    for indice in a_rendre
+                }
+                for indice, tache in taches.items():
+                    video = tache.result()
+                    print(f"{classe} : section {noms[indice]} {'rendue' if video else 'vide'}")
+                    chemin = cache.ajoute(empreintes[indice], video)
+                    videos[indice] = chemin if video is not None else None
+        cache.nettoie(empreintes)
+        videos = [videos[indice] for indice in range(len(noms)) if videos[indice] is not None]
+        if not videos:
+            raise RuntimeError(f"{classe} ne contient aucune animation")
+        sortie = media / "videos" / module_nom / qualite / f"{classe}.mp4"
+        return concatene(videos, sortie)
+
+
+def main(arguments=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("scene", help="classe de la scène à rendre")
+    parser.add_argument("--processus", type=int, default=None,
+        help="nombre de processus de rendu, os.cpu_count() par défaut")
+    parser.add_argument("--qualite", default=QUALITE)
+    parser.add_argument("--media", type=Path, default=None)
+    parser.add_argument("--force", action="store_true",
+        help="rend toutes les sections, même inchangées")
+    args = parser.parse_args(arguments)
+    print(rend(args.scene, args.processus, args.qualite, args.media, args.force))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,8 @@ du LaTeX avec manim.
 
 La première classe est MyTex qui premet d'ajouter facilement des packages pour la
 compilation et de choisir le compilateur latex a utiliser (lualatex par défaut).
+Les templates ainsi créés sont partagés par préambule dans un RegistreTemplates,
+qui précompile chaque préambule en un format LaTeX (.fmt) réutilisé ensuite.
 
 Viennent ensuite les classes Command et Env qui permettent de créer des fonctions
 retournant les commandes ou environnements voulus.
@@ -18,14 +20,203 @@ Les commandes déjà créées pour l'instant sont :
     - `Tend` : fonction à 2 paramètres retournant \\underset{#1 \\to #2}{\\to}
 
 D est un raccourci pour \\text{d}. Utile pour les notations physique de dérivation.
+
+Enfin, CacheTex est un cache disque des SVG produits par LaTeX, partagé entre
+toutes les vidéos, dans le dossier donné par la variable d'environnement
+COURBES_CACHE_TEX (désactivé si elle est vide). Un second niveau,
+CacheGeometrie, y conserve la géométrie des SVG analysés. L'import de ce module
+ne modifie pas manim : active_caches installe ces caches et les formats du
+RegistreTemplates, desactive_caches les retire (PasAPas le fait pendant le
+rendu).
+EnregistreurTex et precompile permettent de remplir ce cache en parallèle avant
+le rendu. Les textes partageant un même template y sont compilés par lots, en
+un seul document de plusieurs pages (voir compile_lot).
 """
 
+import concurrent.futures
+import hashlib
+import json
+import math
+import os
+from pathlib import Path
+import pickle
+import re
+import shutil
+import subprocess
+import tempfile
 import typing
 
 import manim
 from manim.mobject.opengl.opengl_compatibility import ConvertToOpenGL
+import manim.mobject.text.tex_mobject as tex_mobject
+from manim.utils import tex_file_writing
 import numpy as np
 
+# pour l'instant on utilise seulement print pour les log, construction_courbe
+# reprend ce logger
+def logger():
+    pass
+
+logger.info = print
+
+class RegistreTemplates():
+    """
+    Registre des TexTemplate, dédupliqués par hash du compilateur et du
+    préambule : deux classes demandant les mêmes packages partagent le même
+    template.
+
+    Pour chaque préambule enregistré, un format LaTeX est produit une seule
+    fois (compilation -ini avec le package mylatexformat), puis passé au
+    compilateur par l'option -fmt. Le préambule n'est alors plus relu à
+    chaque compilation. Si la production du format échoue, ou si une
+    compilation avec le format échoue, on compile normalement.
+
+    Les compilations par lot (voir :func:`compile_lot`) modifient la classe
+    du document : leur entête est enregistrée comme dérivée de celle du
+    template et dispose de son propre format.
+
+    :param dossier_formats: dossier où stocker les formats. None pour ne
+        pas en utiliser.
+    """
+
+    # compilateurs sachant produire et utiliser un format
+    COMPILATEURS = {"latex", "pdflatex", "lualatex"}
+
+    def __init__(self, dossier_formats=None):
+        self.dossier_formats = Path(dossier_formats) if dossier_formats else None
+        self.templates = {} # hash -> TexTemplate
+        self.formats = {} # hash de l'entête -> compilateur
+        self._original = None # make_tex_compilation_command de manim
+        self._compile_tex = None # compile_tex de manim
+    
+    @staticmethod
+    def _hash(*parties) -> str:
+        hasher = hashlib.sha256()
+        for partie in parties:
+            hasher.update(str(partie).encode())
+            hasher.update(b"\0")
+        return hasher.hexdigest()[:16]
+    
+    @staticmethod
+    def _entete(code: str) -> str:
+        """
+        Partie d'un code LaTeX précédant \\begin{document}.
+        """
+        return code.split("\\begin{document}", 1)[0]
+    
+    def template(self, tex_compiler, preamble: str):
+        """
+        Retourne le template partagé pour ce compilateur et ce préambule.
+        """
+        cle = self._hash(tex_compiler, preamble)
+        if cle not in self.templates:
+            template = manim.TexTemplate(
+                tex_compiler=tex_compiler,
+                preamble=preamble
+            )
+            self.templates[cle] = template
+            if tex_compiler in self.COMPILATEURS:
+                self.formats[self._hash(self._entete(template.body))] = tex_compiler
+        return self.templates[cle]
+    
+    def derive(self, entete: str, entete_derivee: str):
+        """
+        Enregistre une entête dérivée d'une entête déjà enregistrée, avec le
+        même compilateur. Sans effet si cette dernière n'a pas de format.
+        """
+        compilateur = self.formats.get(self._hash(entete))
+        if compilateur is not None:
+            self.formats[self._hash(entete_derivee)] = compilateur
+    
+    def format(self, entete: str, compilateur: str):
+        """
+        Retourne le chemin (sans extension) du format correspondant à
+        l'entête donnée, après l'avoir produit si nécessaire. Retourne None
+        en cas d'échec.
+        """
+        nom = "courbes-" + self._hash(entete)
+        fmt = self.dossier_formats / (nom + ".fmt")
+        if not fmt.exists():
+            self.dossier_formats.mkdir(parents=True, exist_ok=True)
+            # nom temporaire : plusieurs processus peuvent produire le même format
+            provisoire = f"{nom}-{os.getpid()}"
+            source = self.dossier_formats / (provisoire + ".tex")
+            source.write_text(entete + "\\begin{document}\n\\end{document}\n", encoding="utf-8")
+            subprocess.run([
+                compilateur,
+                "-ini",
+                "-interaction=batchmode",
+                f"-jobname={provisoire}",
+                f"&{compilateur}",
+                "mylatexformat.ltx",
+                source.name
+            ], cwd=self.dossier_formats, stdout=subprocess.DEVNULL)
+            produit = self.dossier_formats / (provisoire + ".fmt")
+            if not produit.exists():
+                logger.info(f"Impossible de produire le format {nom}, voir {source.with_suffix('.log')}")
+                # on ne réessaie pas pendant ce rendu
+                self.formats.pop(self._hash(entete), None)
+                return None
+            os.replace(produit, fmt)
+            for extension in (".tex", ".log"):
+                source.with_suffix(extension).unlink(missing_ok=True)
+        return fmt.with_suffix("")
+    
+    def commande(self, tex_compiler, output_format, tex_file, tex_dir):
+        """
+        Remplaçant de manim.utils.tex_file_writing.make_tex_compilation_command
+        qui ajoute l'option -fmt lorsque le préambule du fichier est enregistré.
+        """
+        commande = self._original(tex_compiler, output_format, tex_file, tex_dir)
+        entete = self._entete(Path(tex_file).read_text(encoding="utf-8"))
+        if self.formats.get(self._hash(entete)) == tex_compiler:
+            fmt = self.format(entete, tex_compiler)
+            if fmt is not None:
+                commande.insert(1, f"-fmt={fmt.as_posix()}")
+        return commande
+    
+    def compile_tex(self, tex_file, tex_compiler, output_format):
+        """
+        Remplaçant de manim.utils.tex_file_writing.compile_tex : si la
+        compilation avec un format échoue, ce format est abandonné pour le
+        reste du rendu et le fichier est recompilé normalement.
+        """
+        try:
+            return self._compile_tex(tex_file, tex_compiler, output_format)
+        except ValueError:
+            entete = self._entete(Path(tex_file).read_text(encoding="utf-8"))
+            if self.formats.pop(self._hash(entete), None) is None:
+                raise
+            logger.info(f"Échec de la compilation de {tex_file} avec un format, nouvel essai sans")
+            # un fichier de sortie partiel empêcherait la recompilation
+            Path(tex_file).with_suffix(output_format).unlink(missing_ok=True)
+            return self._compile_tex(tex_file, tex_compiler, output_format)
+    
+    def active(self):
+        """
+        Utilise les formats pour toutes les compilations suivantes.
+        """
+        if self.dossier_formats is None:
+            return
+        if self._original is None:
+            self._original = tex_file_writing.make_tex_compilation_command
+            self._compile_tex = tex_file_writing.compile_tex
+        tex_file_writing.make_tex_compilation_command = self.commande
+        tex_file_writing.compile_tex = self.compile_tex
+    
+    def desactive(self):
+        if self._original is not None:
+            tex_file_writing.make_tex_compilation_command = self._original
+            tex_file_writing.compile_tex = self._compile_tex
+            self._original = None
+            self._compile_tex = None
+
+DOSSIER_FORMATS_TEX = os.environ.get(
+    "COURBES_FORMATS_TEX",
+    Path.home() / ".cache" / "courbes-manim" / "formats"
+)
+registre_templates = RegistreTemplates(DOSSIER_FORMATS_TEX)
+
 class ExtendPackageMetaclass(ConvertToOpenGL): # TODO metaclass conflict
     """
     Metaclass pour les classes définissant un attribut de classe "packages".
@@ -56,11 +247,11 @@ class ExtendPackageMetaclass(ConvertToOpenGL): # TODO metaclass conflict
         nouvelle_cls = super().__new__(cls, name, bases, dictionary)
         L = [r"\{}{}".format(nouvelle_cls.package_command, pack) for pack in packages_herites]
         preamble = "".join(L)
-        template = manim.TexTemplate(
-            tex_compiler=nouvelle_cls.tex_compiler,
-            preamble=preamble
+        # template partagé avec les autres classes de même préambule
+        nouvelle_cls.template = registre_templates.template(
+            nouvelle_cls.tex_compiler,
+            preamble
         )
-        nouvelle_cls.template = template
         return nouvelle_cls
 
 class MyTex(manim.Tex, metaclass=ExtendPackageMetaclass):
@@ -153,4 +344,543 @@ def Tend(var, lim):
 # D est une chaîne constante
 D = Command("text")("d")
 
+class CacheTex():
+    """
+    Cache disque des fichiers SVG produits par la compilation LaTeX.
+
+    La clé d'un SVG est un hash du code LaTeX complet (préambule du template,
+    environnement et contenu), du compilateur et du format de sortie. La
+    taille à l'écran n'intervient pas : elle est appliquée après coup par manim.
+
+    Les écritures sont atomiques (fichier temporaire puis renommage), ce qui
+    permet à plusieurs rendus en parallèle de partager le même dossier.
+    Lorsque la taille totale dépasse `taille_max` (en octets), les fichiers
+    les moins récemment utilisés sont supprimés.
 
+    :param dossier: dossier du cache, créé si besoin.
+    :param taille_max: taille maximale du cache en octets.
+    """
+
+    def __init__(self, dossier, taille_max: int = 200_000_000):
+        self.dossier = Path(dossier)
+        self.taille_max = taille_max
+        self._original = None # tex_to_svg_file de manim, une fois le cache actif
+    
+    def cle(self, expression: str, environment=None, tex_template=None) -> str:
+        if tex_template is None:
+            tex_template = manim.config["tex_template"]
+        if environment is not None:
+            code = tex_template.get_texcode_for_expression_in_env(expression, environment)
+        else:
+            code = tex_template.get_texcode_for_expression(expression)
+        hasher = hashlib.sha256()
+        for partie in (code, str(tex_template.tex_compiler), tex_template.output_format):
+            hasher.update(partie.encode())
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+    
+    def chemin(self, cle: str) -> Path:
+        return self.dossier / (cle + ".svg")
+    
+    def cherche(self, cle: str):
+        """
+        Retourne le chemin du SVG en cache, ou None.
+        """
+        chemin = self.chemin(cle)
+        try:
+            # la date de modification sert à l'éviction (LRU)
+            os.utime(chemin)
+        except FileNotFoundError:
+            return None
+        return chemin
+    
+    def ajoute(self, cle: str, contenu: bytes) -> Path:
+        """
+        Écrit atomiquement le contenu dans le cache et retourne son chemin.
+        """
+        self.dossier.mkdir(parents=True, exist_ok=True)
+        descripteur, temporaire = tempfile.mkstemp(dir=self.dossier, suffix=".tmp")
+        try:
+            with os.fdopen(descripteur, "wb") as f:
+                f.write(contenu)
+            os.replace(temporaire, self.chemin(cle))
+        except BaseException:
+            Path(temporaire).unlink(missing_ok=True)
+            raise
+        self.evince()
+        return self.chemin(cle)
+    
+    def evince(self):
+        """
+        Supprime les fichiers les moins récemment utilisés jusqu'à repasser
+        sous la taille maximale.
+        """
+        fichiers = []
+        for chemin in self.dossier.glob("*.svg"):
+            try:
+                infos = chemin.stat()
+            except FileNotFoundError: # supprimé par un autre processus
+                continue
+            fichiers.append((infos.st_mtime, infos.st_size, chemin))
+        total = sum(taille for _, taille, _ in fichiers)
+        for _, taille, chemin in sorted(fichiers):
+            if total <= self.taille_max:
+                break
+            chemin.unlink(missing_ok=True)
+            total -= taille
+    
+    def tex_to_svg_file(self, expression, environment=None, tex_template=None):
+        """
+        Remplaçant de manim.utils.tex_file_writing.tex_to_svg_file qui
+        consulte le cache avant de compiler.
+        """
+        cle = self.cle(expression, environment, tex_template)
+        chemin = self.cherche(cle)
+        if chemin is not None:
+            return chemin
+        svg = self._original(expression, environment=environment, tex_template=tex_template)
+        return self.ajoute(cle, normalise_svg(Path(svg).read_bytes()))
+    
+    def active(self):
+        """
+        Utilise ce cache pour tous les Tex et MathTex créés par la suite.
+        """
+        if self._original is None:
+            self._original = tex_mobject.tex_to_svg_file
+        tex_mobject.tex_to_svg_file = self.tex_to_svg_file
+    
+    def desactive(self):
+        if self._original is not None:
+            tex_mobject.tex_to_svg_file = self._original
+            self._original = None
+
+class CacheGeometrie():
+    """
+    Second niveau de cache : la géométrie des SVG déjà analysés.
+
+    Pour chaque SVG, on stocke dans un dossier :
+        - points.npy : les points de tous les sous-objets, bout à bout,
+          relu en mémoire partagée (mmap) ;
+        - infos.npz : les bornes de chaque sous-objet dans ce tableau et les
+          groupes nommés du SVG ;
+        - objets.pickle : les sous-objets sans leurs points, avec leur
+          classe (VMobjectFromSVGPath, Rectangle...) et tout leur style
+          (couleurs RGBA de chaque point, dégradés...).
+    
+    Reconstruire un texte revient alors à copier des tableaux, sans analyse
+    XML ni interprétation des commandes de chemin. Un SVG dont les
+    sous-objets ne peuvent pas être sérialisés n'est pas mis en cache.
+
+    :param dossier: dossier du cache, créé si besoin.
+    :param taille_max: taille maximale du cache en octets.
+    """
+
+    VERSION = 2 # format des entrées, fait partie de la clé
+
+    def __init__(self, dossier, taille_max: int = 500_000_000):
+        self.dossier = Path(dossier)
+        self.taille_max = taille_max
+        self._original = None # SingleStringMathTex.generate_mobject de manim
+    
+    def cle(self, svg_mobject) -> str:
+        # mêmes paramètres que SVGMobject.hash_seed, le SVG par son contenu
+        hasher = hashlib.sha256(Path(svg_mobject.file_name).read_bytes())
+        hasher.update(repr((
+            self.VERSION,
+            type(svg_mobject).__name__,
+            svg_mobject.svg_default,
+            svg_mobject.path_string_config,
+            manim.config.renderer
+        )).encode())
+        return hasher.hexdigest()
+    
+    def restaure(self, cle: str, svg_mobject) -> bool:
+        """
+        Ajoute à svg_mobject les sous-objets en cache. Retourne False si la
+        clé est absente.
+        """
+        dossier = self.dossier / cle
+        try:
+            points = np.load(dossier / "points.npy", mmap_mode="r")
+            with np.load(dossier / "infos.npz") as infos:
+                bornes = infos["bornes"]
+                groupes = json.loads(str(infos["groupes"]))
+            with open(dossier / "objets.pickle", "rb") as f:
+                mobjects = pickle.load(f)
+            os.utime(dossier)
+        except (OSError, ValueError, KeyError, EOFError, AttributeError, pickle.UnpicklingError):
+            return False
+        for mob, debut, fin in zip(mobjects, bornes[:-1], bornes[1:]):
+            mob.set_points(np.array(points[debut:fin]))
+        svg_mobject.add(*mobjects)
+        svg_mobject.id_to_vgroup_dict = {
+            nom: manim.VGroup(*[mobjects[j] for j in indices])
+            for nom, indices in groupes.items()
+        }
+        return True
+    
+    def enregistre(self, cle: str, svg_mobject):
+        """
+        Enregistre atomiquement la géométrie de svg_mobject, qui vient
+        d'être construit à partir de son SVG.
+        """
+        mobjects = svg_mobject.submobjects
+        indices = {id(mob): i for i, mob in enumerate(mobjects)}
+        groupes = {
+            nom: [indices[id(mob)] for mob in groupe.submobjects if id(mob) in indices]
+            for nom, groupe in getattr(svg_mobject, "id_to_vgroup_dict", {}).items()
+        }
+        try:
+            objets = pickle.dumps([
+                mob.copy().set_points(np.zeros((0, 3))) for mob in mobjects
+            ])
+        except Exception:
+            return # sous-objet non sérialisable : pas de cache
+        self.dossier.mkdir(parents=True, exist_ok=True)
+        provisoire = Path(tempfile.mkdtemp(dir=self.dossier, prefix=".tmp-"))
+        try:
+            np.save(
+                provisoire / "points.npy",
+                np.concatenate([mob.points for mob in mobjects] or [np.zeros((0, 3))])
+            )
+            np.savez(
+                provisoire / "infos.npz",
+                bornes=np.cumsum([0] + [len(mob.points) for mob in mobjects]),
+                groupes=np.array(json.dumps(groupes))
+            )
+            (provisoire / "objets.pickle").write_bytes(objets)
+            os.replace(provisoire, self.dossier / cle)
+        except OSError:
+            # déjà enregistré par un autre processus
+            pass
+        finally:
+            shutil.rmtree(provisoire, ignore_errors=True)
+        self.evince()
+    
+    def evince(self):
+        """
+        Supprime les entrées les moins récemment utilisées jusqu'à repasser
+        sous la taille maximale.
+        """
+        entrees = []
+        for dossier in self.dossier.iterdir():
+            if dossier.name.startswith("."):
+                continue
+            try:
+                taille = sum(f.stat().st_size for f in dossier.iterdir())
+                entrees.append((dossier.stat().st_mtime, taille, dossier))
+            except FileNotFoundError: # supprimé par un autre processus
+                continue
+        total = sum(taille for _, taille, _ in entrees)
+        for _, taille, dossier in sorted(entrees):
+            if total <= self.taille_max:
+                break
+            shutil.rmtree(dossier, ignore_errors=True)
+            total -= taille
+    
+    def generate_mobject(self, svg_mobject):
+        """
+        Remplaçant de SingleStringMathTex.generate_mobject qui construit les
+        sous-objets à partir du cache, sinon en analysant le SVG. Seul le
+        rendu Cairo est pris en charge.
+        """
+        if manim.config.renderer != manim.RendererType.CAIRO:
+            return self._original(svg_mobject)
+        cle = self.cle(svg_mobject)
+        if not self.restaure(cle, svg_mobject):
+            self._original(svg_mobject)
+            self.enregistre(cle, svg_mobject)
+        return svg_mobject
+    
+    def active(self):
+        """
+        Utilise ce cache pour tous les Tex et MathTex créés par la suite.
+        """
+        if self._original is None:
+            self._original = tex_mobject.SingleStringMathTex.generate_mobject
+        cache = self
+        def generate_mobject(svg_mobject):
+            return cache.generate_mobject(svg_mobject)
+        tex_mobject.SingleStringMathTex.generate_mobject = generate_mobject
+    
+    def desactive(self):
+        if self._original is not None:
+            tex_mobject.SingleStringMathTex.generate_mobject = self._original
+            self._original = None
+
+DOSSIER_CACHE_TEX = os.environ.get(
+    "COURBES_CACHE_TEX",
+    Path.home() / ".cache" / "courbes-manim" / "tex"
+)
+cache_tex = None
+cache_geometrie = None
+if DOSSIER_CACHE_TEX:
+    cache_tex = CacheTex(DOSSIER_CACHE_TEX)
+    cache_geometrie = CacheGeometrie(Path(DOSSIER_CACHE_TEX) / "geometrie")
+
+def active_caches():
+    """
+    Installe dans manim les formats de registre_templates et, s'ils
+    existent, cache_tex et cache_geometrie.
+    """
+    registre_templates.active()
+    if cache_tex is not None:
+        cache_tex.active()
+        cache_geometrie.active()
+
+def desactive_caches():
+    """
+    Rend à manim ses fonctions d'origine.
+    """
+    if cache_tex is not None:
+        cache_geometrie.desactive()
+        cache_tex.desactive()
+    registre_templates.desactive()
+
+
+# SVG minimal renvoyé pendant un enregistrement, pour que les objets
+# manim aient tout de même une géométrie
+SVG_FICTIF = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="1" height="1">'
+    '<path d="M 0 0 L 1 0 L 1 1 Z"/></svg>'
+)
+
+class EnregistreurTex():
+    """
+    Gestionnaire de contexte qui enregistre toutes les demandes de
+    compilation LaTeX sans rien compiler.
+
+    Dans le bloc with, chaque Tex ou MathTex créé ajoute un triplet
+    (expression, environnement, template) à la liste retournée par
+    __enter__ et reçoit un SVG fictif.
+    """
+
+    actifs = 0 # nombre d'enregistrements en cours
+
+    def __init__(self):
+        self.entrees = []
+        self._precedent = None
+        self._svg = None
+    
+    def tex_to_svg_file(self, expression, environment=None, tex_template=None):
+        if tex_template is None:
+            tex_template = manim.config["tex_template"]
+        self.entrees.append((expression, environment, tex_template))
+        return self._svg
+    
+    def __enter__(self):
+        descripteur, chemin = tempfile.mkstemp(suffix=".svg")
+        with os.fdopen(descripteur, "w") as f:
+            f.write(SVG_FICTIF)
+        self._svg = Path(chemin)
+        self._precedent = tex_mobject.tex_to_svg_file
+        tex_mobject.tex_to_svg_file = self.tex_to_svg_file
+        EnregistreurTex.actifs += 1
+        return self.entrees
+    
+    def __exit__(self, *exc):
+        tex_mobject.tex_to_svg_file = self._precedent
+        EnregistreurTex.actifs -= 1
+        self._svg.unlink(missing_ok=True)
+        return False
+
+# environnement dont chaque occurrence devient une page du document
+ENV_FRAGMENT = "courbesfragment"
+
+def normalise_svg(contenu: bytes) -> bytes:
+    """
+    Renumérote les polices dans les identifiants des glyphes
+    (g<police>-<caractère>) d'un SVG produit par dvisvgm, dans l'ordre de
+    leur première utilisation dans le dessin.
+
+    dvisvgm numérote les polices pour tout le document : sans cela, une
+    page d'une compilation par lot n'aurait pas les mêmes identifiants que
+    le même texte compilé seul.
+    """
+    texte = contenu.decode("utf-8")
+    ordre = {}
+    # utilisations d'abord, puis définitions éventuellement inutilisées
+    for police in re.findall(r"#g(\d+)-\d", texte.split("</defs>", 1)[-1]) \
+            + re.findall(r"(?<=['\"#])g(\d+)-\d", texte):
+        ordre.setdefault(police, len(ordre))
+    return re.sub(
+        r"(?<=['\"#])g(\d+)-(?=\d)",
+        lambda m: f"g{ordre[m.group(1)]}-",
+        texte
+    ).encode("utf-8")
+
+def _gabarit_lot(tex_template):
+    """
+    Retourne le début du corps du template (jusqu'au contenu), ce même
+    début pour une compilation par lot, et la fin du corps. Lève ValueError
+    si le template ne se prête pas à une compilation par lot.
+    """
+    classe = tex_template.documentclass
+    corps = tex_template.body
+    if "{standalone}" not in classe or corps.count(tex_template.placeholder_text) != 1:
+        raise ValueError("Compilation par lot impossible avec ce template")
+    avant, apres = corps.split(tex_template.placeholder_text)
+    options = re.fullmatch(r"\\documentclass(?:\[(.*)\])?\{standalone\}", classe.strip())
+    if options is None:
+        raise ValueError("Compilation par lot impossible avec ce template")
+    options = [o for o in [options.group(1), f"multi={ENV_FRAGMENT}"] if o]
+    avant_lot = avant.replace(
+        classe,
+        f"\\documentclass[{','.join(options)}]{{standalone}}\n"
+        f"\\newenvironment{{{ENV_FRAGMENT}}}{{}}{{}}",
+        1
+    )
+    return avant, avant_lot, apres
+
+def _prepare_formats_lots(templates):
+    """
+    Enregistre et produit dans le processus principal les formats des
+    compilations par lot : les processus de compilation ne partagent pas
+    son registre, et le produiraient chacun de leur côté.
+    """
+    for tex_template in templates:
+        try:
+            avant, avant_lot, _ = _gabarit_lot(tex_template)
+        except ValueError:
+            continue
+        entete = registre_templates._entete(avant_lot)
+        registre_templates.derive(registre_templates._entete(avant), entete)
+        compilateur = registre_templates.formats.get(registre_templates._hash(entete))
+        if compilateur is not None and registre_templates.dossier_formats is not None:
+            registre_templates.format(entete, compilateur)
+
+def compile_lot(entrees, tex_template) -> list:
+    """
+    Compile en un seul appel LaTeX une liste de couples
+    (expression, environnement) partageant le même template.
+
+    Chaque fragment est placé dans sa propre page grâce à l'option multi
+    de la classe standalone, avec exactement le même code que pour une
+    compilation isolée. Les pages sont ensuite converties séparément par
+    dvisvgm, et les identifiants des glyphes normalisés par
+    :func:`normalise_svg` comme pour une compilation isolée.
+
+    Retourne la liste des chemins des SVG, dans l'ordre des entrées.
+    Lève ValueError si le template ne s'y prête pas ou si la compilation
+    échoue.
+    """
+    if tex_template is None:
+        tex_template = manim.config["tex_template"]
+    avant, avant_lot, apres = _gabarit_lot(tex_template)
+    fragments = []
+    for expression, environment in entrees:
+        if environment is not None:
+            code = tex_template.get_texcode_for_expression_in_env(expression, environment)
+        else:
+            code = tex_template.get_texcode_for_expression(expression)
+        fragments.append(
+            f"\\begin{{{ENV_FRAGMENT}}}" + code[len(avant):len(code) - len(apres)]
+            + f"\\end{{{ENV_FRAGMENT}}}"
+        )
+    code = avant_lot + "\n".join(fragments) + apres
+    # la classe du document change : format propre aux lots (déjà
+    # enregistré par precompile dans le processus principal)
+    registre_templates.derive(
+        registre_templates._entete(avant),
+        registre_templates._entete(code)
+    )
+
+    tex_dir = manim.config.get_dir("tex_dir")
+    tex_dir.mkdir(parents=True, exist_ok=True)
+    tex_file = tex_dir / ("lot-" + hashlib.sha256(code.encode()).hexdigest()[:16] + ".tex")
+    tex_file.write_text(code, encoding="utf-8")
+    sortie = tex_file_writing.compile_tex(
+        tex_file,
+        tex_template.tex_compiler,
+        tex_template.output_format
+    )
+    conversion = subprocess.run([
+        "dvisvgm",
+        *(["--pdf"] if tex_template.output_format == ".pdf" else []),
+        f"--page=1-{len(entrees)}",
+        "--no-fonts",
+        "--verbosity=0",
+        f"--output={tex_file.with_suffix('').as_posix()}-%p.svg",
+        sortie.as_posix()
+    ], stdout=subprocess.DEVNULL)
+    if conversion.returncode != 0:
+        raise ValueError(f"Échec de dvisvgm pour {sortie}")
+    # dvisvgm complète éventuellement les numéros de page par des zéros
+    pages = {
+        int(chemin.stem.rsplit("-", 1)[1]): chemin
+        for chemin in tex_dir.glob(tex_file.stem + "-*.svg")
+    }
+    if sorted(pages) != list(range(1, len(entrees) + 1)):
+        raise ValueError(f"Nombre de pages incorrect pour {tex_file}")
+    return [pages[i] for i in sorted(pages)]
+
+def _initialise_processus(dossier, formats):
+    # chaque processus compile dans son propre dossier : manim supprime
+    # les fichiers intermédiaires du dossier Tex après chaque compilation.
+    # Ces dossiers sont dans `dossier`, supprimé après le lot.
+    manim.config.tex_dir = tempfile.mkdtemp(prefix="courbes-tex-", dir=dossier)
+    # un processus démarré par spawn repart d'un registre vide
+    registre_templates.formats.update(formats)
+    active_caches()
+
+def _compile(lot):
+    # lot est une liste de triplets partageant le même template
+    tex_template = lot[0][2]
+    try:
+        svgs = compile_lot([(e, env) for e, env, _ in lot], tex_template)
+    except Exception:
+        # y compris les erreurs LaTeX d'un fragment
+        svgs = None
+    erreurs = []
+    for i, (expression, environment, _) in enumerate(lot):
+        try:
+            if svgs is None:
+                # un fragment a pu faire échouer tout le lot
+                cache_tex.tex_to_svg_file(expression, environment, tex_template)
+            else:
+                cle = cache_tex.cle(expression, environment, tex_template)
+                cache_tex.ajoute(cle, normalise_svg(svgs[i].read_bytes()))
+        except Exception as e:
+            erreurs.append(f"{expression[:40]!r} : {e}")
+    return erreurs
+
+def precompile(entrees, processus=None) -> list:
+    """
+    Compile en parallèle les triplets (expression, environnement, template)
+    absents du cache disque. Les processus partagent le cache, le rendu qui
+    suit n'a donc plus qu'à lire les SVG.
+
+    Les triplets sont regroupés par template puis répartis en lots, un
+    lot étant compilé en un seul appel LaTeX par :func:`compile_lot`.
+
+    :param processus: nombre de processus, os.cpu_count() par défaut.
+
+    Retourne la liste des messages d'erreur, éventuellement vide. Les erreurs
+    réapparaîtront lors du rendu, là où le texte est utilisé.
+    """
+    if cache_tex is None:
+        return []
+    a_compiler = {}
+    for expression, environment, tex_template in entrees:
+        cle = cache_tex.cle(expression, environment, tex_template)
+        if cle not in a_compiler and not cache_tex.chemin(cle).exists():
+            a_compiler[cle] = (expression, environment, tex_template)
+    if not a_compiler:
+        return []
+    processus = processus or os.cpu_count() or 1
+    par_template = {}
+    for entree in a_compiler.values():
+        par_template.setdefault(id(entree[2]), []).append(entree)
+    lots = []
+    for entrees_template in par_template.values():
+        taille = math.ceil(len(entrees_template) / processus)
+        for i in range(0, len(entrees_template), taille):
+            lots.append(entrees_template[i:i + taille])
+    _prepare_formats_lots(lot[0][2] for lot in lots)
+    with tempfile.TemporaryDirectory(prefix="courbes-tex-") as dossier, \
+            concurrent.futures.ProcessPoolExecutor(
+                max_workers=processus,
+                initializer=_initialise_processus,
+                initargs=(dossier, dict(registre_templates.formats))
+            ) as executeur:
+        return [erreur for erreurs in executeur.map(_compile, lots) for erreur in erreurs]
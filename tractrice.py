@@ -32,8 +32,8 @@ class Tractrice(cc.PasAPas):
             lambda M: np.array([-M[0], M[1], 0]),
             "-t",
             (2,3),
-            Tex("On a $M(-t) = "+ tc.Matrix(["-x(t)", "y(t)"]) +"$").scale(0.7).move_to(cc.PasAPas.TEXT_DROITE),
-            Tex("M(-t) est le symétrique de M(t) par rapport à (Oy)").scale(0.7).move_to(cc.PasAPas.TEXT_DROITE),
+            cc.Differe(Tex, "On a $M(-t) = "+ tc.Matrix(["-x(t)", "y(t)"]) +"$").scale(0.7).move_to(cc.PasAPas.TEXT_DROITE),
+            cc.Differe(Tex, "M(-t) est le symétrique de M(t) par rapport à (Oy)").scale(0.7).move_to(cc.PasAPas.TEXT_DROITE),
             ["$\mathbb{R}$", "$[0, +\\infty[$", "$]-\\infty, 0]$"],
             (0, 4), # p_range pour la partie à étudier
             couleur=BLUE # couleur du symétrique
@@ -195,32 +195,29 @@ class Tractrice(cc.PasAPas):
     def bouge_points(self):
         t_range = self.SYMETRIES[0].p_range
 
-        point_M = Dot(point=self.repere.c2p(0,1), color=ORANGE)
-        txt_M = Tex("F").scale(0.8).next_to(point_M, (UP + RIGHT)*0.5)
-        point_N = Dot(point=self.repere.c2p(0,0), color=ORANGE)
-        txt_N = Tex("D").scale(0.8).next_to(point_N, (DOWN)*0.5)
-        point_E = Dot(point=self.repere.c2p(0,0), color=ORANGE)
-        txt_E = Tex("E").scale(0.8).next_to(point_E, (DOWN)*0.5)
         param = ValueTracker(0)
-
-        point_M.add_updater(lambda m: m.move_to(
-            self.repere.c2p(*self.courbe(param.get_value()))
-        ))
-        txt_M.add_updater(lambda m: m.next_to(point_M, (UP + RIGHT)*0.5))
-        point_N.add_updater(lambda m: m.move_to(
-            self.repere.c2p(param.get_value(), 0, 0)
-        ))
-        txt_N.add_updater(lambda m: m.next_to(point_N, (DOWN)*0.5))
-        point_E.add_updater(lambda m: m.move_to(
-            self.repere.c2p(2 + param.get_value()*0.8, 0, 0)
-        ))
-        txt_E.add_updater(lambda m: m.next_to(point_E, (DOWN)*0.5))
-
-        def dessine_laisse():
-            return Line(point_M.get_center(), point_N.get_center(), color=ORANGE)
-
-        laisse = always_redraw(dessine_laisse)
-        self.add(point_M, txt_M, point_N, txt_N, laisse, point_E, txt_E)
+        # une seule mise à jour par image pour les 3 points, leurs
+        # étiquettes et la laisse
+        cinematique = cc.Cinematique(param)
+        # la courbe n'est évaluée qu'une fois, F est interpolé dans la table
+        table = cc.TableCourbe(self, 0, t_range[1])
+        point_M = cinematique.point(
+            Dot(color=ORANGE),
+            table.au_parametre,
+            Tex("F").scale(0.8), (UP + RIGHT)*0.5
+        )
+        point_N = cinematique.point(
+            Dot(color=ORANGE),
+            lambda t: self.repere.c2p(t, 0, 0),
+            Tex("D").scale(0.8), DOWN*0.5
+        )
+        cinematique.point(
+            Dot(color=ORANGE),
+            lambda t: self.repere.c2p(2 + t*0.8, 0, 0),
+            Tex("E").scale(0.8), DOWN*0.5
+        )
+        cinematique.segment(Line(color=ORANGE), point_M, point_N)
+        self.add(*cinematique.mobjects())
         anim = param.animate(run_time=4, rate_func=linear).set_value(t_range[1])
         self.play(anim)
         self.wait(self.INTERVALLE_LEGENDE)